@@ -0,0 +1,6 @@
+"""Markdown Toolkit benchmark suite.
+
+Run with `python -m benchmarks`, see `python -m benchmarks --help` for options.
+
+Compare two runs with `python -m markdown_toolkit.bench compare base.json head.json`.
+"""
@@ -0,0 +1,45 @@
+"""Benchmark suite command line interface."""
+import argparse
+import json
+
+from benchmarks.suite import PRESETS, environment, run_benchmarks, summary
+
+
+def main(argv=None):
+    """Runs the benchmark suite and writes the results."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Markdown Toolkit benchmarks."
+    )
+    parser.add_argument("--preset", choices=PRESETS, default="quick")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", dest="pattern", help="Benchmark name regex.")
+    parser.add_argument("--output", help="Path to write JSON results to.")
+    parser.add_argument("--summary", help="Path to write the markdown summary to.")
+    parser.add_argument(
+        "--no-memory",
+        dest="memory",
+        action="store_false",
+        help="Skip the tracemalloc peak memory measurement.",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        preset=args.preset,
+        repeat=args.repeat,
+        pattern=args.pattern,
+        memory=args.memory,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="UTF-8") as file:
+            json.dump(
+                {"environment": environment(), "results": results}, file, indent=2
+            )
+    document = summary(results)
+    if args.summary:
+        document.write(args.summary, trailing_whitespace=True)
+    else:
+        print(document.render())
+
+
+if __name__ == "__main__":
+    main()
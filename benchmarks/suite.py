@@ -0,0 +1,726 @@
+"""Benchmark definitions and runner."""
+from __future__ import annotations
+
+import csv
+import inspect
+import json
+import platform
+import re
+import sqlite3
+from collections import defaultdict
+from functools import partial
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable, NamedTuple, Optional
+
+from markdown_toolkit import MarkdownDocument, MarkdownInjector, from_file
+from markdown_toolkit.bench import measure
+from markdown_toolkit.bench.workloads import generate, write
+from markdown_toolkit.instrumentation import Instrumentation
+from markdown_toolkit.sinks import CSVSink
+from markdown_toolkit.utils import cleandoc, code, list_item, sanitise_attribute
+
+PRESETS = ("quick", "full")
+
+
+class Benchmark(NamedTuple):
+    """Benchmark registration.
+
+    The setup function is called once per size, outside of the timings, and returns
+    the callable to time.
+    """
+
+    name: str
+    setup: Callable[[int], Callable[[], object]]
+    sizes: dict
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, quick: tuple, full: tuple):
+    """Registers a benchmark setup function with the sizes to run it at.
+
+    Args:
+        name (str): Benchmark name.
+        quick (tuple): Sizes for the quick preset.
+        full (tuple): Sizes for the full preset.
+    """
+
+    def register(setup: Callable[[int], Callable[[], object]]):
+        BENCHMARKS.append(Benchmark(name, setup, {"quick": quick, "full": full}))
+        return setup
+
+    return register
+
+
+def _rows(size: int) -> list[dict]:
+    return [
+        {"Account": f"account-{idx}", "Owner": f"team-{idx % 50}", "Cost": idx * 1.5}
+        for idx in range(size)
+    ]
+
+
+def _anchored_document(size: int) -> str:
+    return "\n".join(generate(size, anchor_density=1 / min(size, 1000)))
+
+
+@benchmark("document.text", quick=(10_000, 100_000), full=(100_000, 1_000_000))
+def document_text(size: int):
+    """Appends lines of text to a document."""
+
+    def run():
+        doc = MarkdownDocument()
+        for _ in range(size):
+            doc.text("Line of text.")
+        return doc
+
+    return run
+
+
+@benchmark(
+    "document.text.instrumented", quick=(10_000, 100_000), full=(100_000, 1_000_000)
+)
+def document_text_instrumented(size: int):
+    """Appends lines of text to an instrumented document.
+
+    Compare with `document.text`, which has instrumentation disabled and should be
+    unaffected by it existing.
+    """
+
+    def run():
+        doc = MarkdownDocument(instrumentation=Instrumentation())
+        for _ in range(size):
+            doc.text("Line of text.")
+        return doc
+
+    return run
+
+
+@benchmark("document.list", quick=(10_000, 100_000), full=(100_000, 1_000_000))
+def document_list(size: int):
+    """Appends list items to a document."""
+
+    def run():
+        doc = MarkdownDocument()
+        for _ in range(size):
+            doc.list("List item.")
+        return doc
+
+    return run
+
+
+@benchmark("document.list.context", quick=(100_000,), full=(100_000, 1_000_000))
+def document_list_context(size: int):
+    """Nests a list item under each of `size` list context managers."""
+
+    def run():
+        doc = MarkdownDocument()
+        for _ in range(size // 2):
+            with doc.list("Parent item."):
+                doc.list("Child item.")
+        return doc
+
+    return run
+
+
+def _tree(size: int) -> dict:
+    """Tree of `size` nodes, ten children per node."""
+    tree = {}
+    parents = [tree]
+    for idx in range(size):
+        children = parents[idx // 10]
+        children[f"Node {idx}"] = {}
+        parents.append(children[f"Node {idx}"])
+    return tree
+
+
+@benchmark("document.list_tree", quick=(10_000, 100_000), full=(100_000, 1_000_000))
+def document_list_tree(size: int):
+    """Renders a tree of list items in one call."""
+    tree = _tree(size)
+
+    def run():
+        doc = MarkdownDocument()
+        doc.list_tree(tree)
+        return doc
+
+    return run
+
+
+@benchmark(
+    "document.list_tree.nested", quick=(10_000, 100_000), full=(100_000, 1_000_000)
+)
+def document_list_tree_nested(size: int):
+    """Renders the same tree as `document.list_tree` with nested list contexts."""
+    tree = _tree(size)
+
+    def add(doc: MarkdownDocument, children: dict):
+        for item, grandchildren in children.items():
+            with doc.list(item):
+                add(doc, grandchildren)
+
+    def run():
+        doc = MarkdownDocument()
+        add(doc, tree)
+        return doc
+
+    return run
+
+
+@benchmark("document.hierarchy", quick=(10_000, 100_000), full=(100_000, 1_000_000))
+def document_hierarchy(size: int):
+    """Renders headings and tables for a tree of groups, ten rows per group."""
+    rows = _rows(size)
+    nodes = [
+        {"name": f"Group {idx}", "rows": rows[idx * 10 : idx * 10 + 10], "children": []}
+        for idx in range(size // 10)
+    ]
+    for idx, node in enumerate(nodes[1:], 1):
+        nodes[(idx - 1) // 10]["children"].append(node)
+
+    def run():
+        doc = MarkdownDocument()
+        doc.hierarchy(nodes[0], titles=["Account", "Owner", "Cost"])
+        return doc
+
+    return run
+
+
+@benchmark("document.render", quick=(100_000,), full=(1_000_000,))
+def document_render(size: int):
+    """Renders a document of lines to a string."""
+    doc = MarkdownDocument()
+    for _ in range(size):
+        doc.text("Line of text.")
+    return doc.render
+
+
+@benchmark("table.bulk", quick=(10_000, 100_000), full=(10_000, 100_000, 1_000_000))
+def table_bulk(size: int):
+    """Renders a list of dictionaries as a table."""
+    rows = _rows(size)
+
+    def run():
+        doc = MarkdownDocument()
+        doc.table(rows)
+        return doc
+
+    return run
+
+
+@benchmark(
+    "table.aggregates", quick=(10_000, 100_000), full=(10_000, 100_000, 1_000_000)
+)
+def table_aggregates(size: int):
+    """Renders a table with count, sum and mean footer rows."""
+    rows = _rows(size)
+
+    def run():
+        doc = MarkdownDocument()
+        doc.table(
+            rows,
+            titles=["Account", "Owner", "Cost"],
+            aggregates={"Account": "count", "Cost": ["sum", "mean"]},
+        )
+        return doc
+
+    return run
+
+
+@benchmark("table.unique", quick=(10_000, 100_000), full=(100_000, 1_000_000))
+def table_unique(size: int):
+    """Renders a table of rows that are each repeated, dropping the duplicates."""
+    rows = _rows(size // 2) * 2
+
+    def run():
+        doc = MarkdownDocument()
+        doc.table(rows, titles=["Account", "Owner", "Cost"], unique=True)
+        return doc
+
+    return run
+
+
+@benchmark(
+    "table.unique.baseline", quick=(10_000, 100_000), full=(100_000, 1_000_000)
+)
+def table_unique_baseline(size: int):
+    """Renders the same table as `table.unique`, deduplicating with a set first."""
+    rows = _rows(size // 2) * 2
+
+    def run():
+        doc = MarkdownDocument()
+        seen = set()
+        unique_rows = []
+        for row in rows:
+            key = tuple(row.values())
+            if key not in seen:
+                seen.add(key)
+                unique_rows.append(row)
+        doc.table(unique_rows)
+        return doc
+
+    return run
+
+
+@benchmark("table.paginated", quick=(10_000, 100_000), full=(100_000, 1_000_000))
+def table_paginated(size: int):
+    """Streams rows into collapsed pages of 500 rows."""
+
+    def run():
+        doc = MarkdownDocument()
+        doc.table(
+            iter(_rows(size)),
+            titles=["Account", "Owner", "Cost"],
+            page_size=500,
+            paginate="collapsed",
+        )
+        return doc
+
+    return run
+
+
+@benchmark("table.sinks", quick=(10_000, 100_000), full=(100_000, 1_000_000))
+def table_sinks(size: int):
+    """Writes every row to a CSV file while rendering the first 100."""
+    rows = _rows(size)
+
+    def run():
+        doc = MarkdownDocument()
+        with CSVSink(StringIO()) as sink:
+            doc.table(
+                rows, titles=["Account", "Owner", "Cost"], sinks=[sink], truncate=100
+            )
+        return doc
+
+    return run
+
+
+@benchmark(
+    "table.sinks.baseline", quick=(10_000, 100_000), full=(100_000, 1_000_000)
+)
+def table_sinks_baseline(size: int):
+    """Renders the whole table, then writes the rows to CSV in a second pass."""
+    rows = _rows(size)
+
+    def run():
+        doc = MarkdownDocument()
+        doc.table(rows)
+        writer = csv.DictWriter(StringIO(), fieldnames=["Account", "Owner", "Cost"])
+        writer.writeheader()
+        writer.writerows(rows)
+        return doc
+
+    return run
+
+
+def _cost_records(size: int) -> list[dict]:
+    return [
+        {
+            "Account": f"account-{idx % 100}",
+            "Month": f"2024-{idx % 12 + 1:02}",
+            "Cost": idx,
+        }
+        for idx in range(size)
+    ]
+
+
+@benchmark("table.pivot", quick=(100_000,), full=(1_000_000,))
+def table_pivot(size: int):
+    """Pivots cost records into an account by month table."""
+    records = _cost_records(size)
+
+    def run():
+        doc = MarkdownDocument()
+        doc.pivot_table(records, index="Account", columns="Month", values="Cost")
+        return doc
+
+    return run
+
+
+@benchmark("table.pivot.baseline", quick=(100_000,), full=(1_000_000,))
+def table_pivot_baseline(size: int):
+    """Pivots the same records as `table.pivot` up front, then renders the table."""
+    records = _cost_records(size)
+
+    def run():
+        doc = MarkdownDocument()
+        pivot = defaultdict(lambda: defaultdict(int))
+        months = {}
+        for record in records:
+            pivot[record["Account"]][record["Month"]] += record["Cost"]
+            months[record["Month"]] = None
+        doc.table(
+            [
+                {"Account": account, **{month: cells.get(month, "") for month in months}}
+                for account, cells in pivot.items()
+            ]
+        )
+        return doc
+
+    return run
+
+
+def _wide_rows(size: int) -> list[dict]:
+    return [
+        {f"column {column}": idx * column for column in range(60)}
+        for idx in range(size)
+    ]
+
+
+PROJECTED_COLUMNS = [f"column {column}" for column in range(0, 60, 8)]
+
+
+@benchmark("table.projected", quick=(10_000, 100_000), full=(100_000, 1_000_000))
+def table_projected(size: int):
+    """Renders 8 of 60 columns, with a predicate and formatters."""
+    rows = _wide_rows(size)
+
+    def run():
+        doc = MarkdownDocument()
+        doc.table(
+            rows,
+            columns=PROJECTED_COLUMNS,
+            where=lambda row: row["column 1"] % 10,
+            formatters={"column 8": "${:,}".format, "column 16": code},
+        )
+        return doc
+
+    return run
+
+
+@benchmark(
+    "table.projected.baseline", quick=(10_000, 100_000), full=(100_000, 1_000_000)
+)
+def table_projected_baseline(size: int):
+    """Renders the same table as `table.projected` by preparing rows up front."""
+    rows = _wide_rows(size)
+
+    def run():
+        doc = MarkdownDocument()
+        projected = []
+        for row in rows:
+            if row["column 1"] % 10:
+                cells = {column: row[column] for column in PROJECTED_COLUMNS}
+                cells["column 8"] = f"${cells['column 8']:,}"
+                cells["column 16"] = code(cells["column 16"])
+                projected.append(cells)
+        doc.table(projected)
+        return doc
+
+    return run
+
+
+@benchmark(
+    "table.add_row", quick=(10_000, 100_000), full=(10_000, 100_000, 1_000_000)
+)
+def table_add_row(size: int):
+    """Adds rows one at a time to a table context manager."""
+    rows = [
+        {"account": row["Account"], "owner": row["Owner"], "cost": row["Cost"]}
+        for row in _rows(size)
+    ]
+
+    def run():
+        doc = MarkdownDocument()
+        with doc.table(titles=["Account", "Owner", "Cost"]) as table:
+            for row in rows:
+                table.add_row(**row)
+        return doc
+
+    return run
+
+
+@benchmark("table.grouped", quick=(10_000, 100_000), full=(10_000, 100_000, 1_000_000))
+def table_grouped(size: int):
+    """Renders a table per owner, fifty groups."""
+    rows = _rows(size)
+
+    def run():
+        doc = MarkdownDocument()
+        doc.grouped_tables(rows, by="Owner", titles=["Account", "Cost"])
+        return doc
+
+    return run
+
+
+def _csv_file(size: int) -> TemporaryDirectory:
+    directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+    with open(Path(directory.name) / "table.csv", "w", encoding="UTF-8") as file:
+        writer = csv.DictWriter(file, fieldnames=["Account", "Owner", "Cost"])
+        writer.writeheader()
+        writer.writerows(_rows(size))
+    return directory
+
+
+@benchmark("table.csv", quick=(10_000, 100_000), full=(100_000, 1_000_000))
+def table_csv(size: int):
+    """Renders two columns of a CSV file as a table."""
+    directory = _csv_file(size)
+
+    def run():
+        doc = MarkdownDocument()
+        doc.table_from_csv(
+            Path(directory.name) / "table.csv", columns=["Account", "Cost"]
+        )
+        return doc
+
+    # Cleaned up when the benchmark callable is discarded.
+    run.directory = directory
+    return run
+
+
+@benchmark("table.csv.dictreader", quick=(10_000, 100_000), full=(100_000, 1_000_000))
+def table_csv_dictreader(size: int):
+    """Renders the same table as `table.csv` through `csv.DictReader`."""
+    directory = _csv_file(size)
+
+    def run():
+        doc = MarkdownDocument()
+        path = Path(directory.name) / "table.csv"
+        with open(path, encoding="UTF-8", newline="") as file:
+            doc.table(
+                [
+                    {"Account": row["Account"], "Cost": row["Cost"]}
+                    for row in csv.DictReader(file)
+                ]
+            )
+        return doc
+
+    run.directory = directory
+    return run
+
+
+@benchmark("table.jsonl", quick=(10_000, 100_000), full=(100_000, 1_000_000))
+def table_jsonl(size: int):
+    """Renders a JSON Lines file of nested records as a table."""
+    directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+    path = Path(directory.name) / "table.jsonl"
+    with open(path, "w", encoding="UTF-8") as file:
+        for row in _rows(size):
+            owner = row.pop("Owner")
+            file.write(json.dumps({**row, "owner": {"team": owner}}) + "\n")
+
+    def run():
+        doc = MarkdownDocument()
+        doc.table_from_jsonl(path)
+        return doc
+
+    # Cleaned up when the benchmark callable is discarded.
+    run.directory = directory
+    return run
+
+
+@benchmark("table.cursor", quick=(10_000, 100_000), full=(100_000, 1_000_000))
+def table_cursor(size: int):
+    """Renders the results of an SQLite query as a table."""
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE costs (account TEXT, owner TEXT, cost REAL)")
+    connection.executemany(
+        "INSERT INTO costs VALUES (:Account, :Owner, :Cost)", _rows(size)
+    )
+
+    def run():
+        doc = MarkdownDocument()
+        doc.table_from_cursor(connection.execute("SELECT * FROM costs"))
+        return doc
+
+    return run
+
+
+@benchmark("injector.parse", quick=(10_000, 100_000), full=(10_000, 100_000, 500_000))
+def injector_parse(size: int):
+    """Parses a synthetic document with an anchor pair every thousand lines."""
+    text = _anchored_document(size)
+    return lambda: MarkdownInjector(StringIO(text))
+
+
+@benchmark("injector.update", quick=(10_000, 100_000), full=(10_000, 100_000, 500_000))
+def injector_update(size: int):
+    """Replaces the value of the last anchor in a document."""
+    injector = MarkdownInjector(StringIO(_anchored_document(size)))
+    anchor = list(vars(injector.anchors).values())[-1]
+
+    def run():
+        anchor.value = "Replaced text."
+
+    return run
+
+
+@benchmark("injector.anchors", quick=(10_000,), full=(10_000, 100_000))
+def injector_anchors(size: int):
+    """Parses a document with `size` anchors, one pair every ten lines.
+
+    Peak memory includes the anchor objects kept by the injector.
+    """
+    text = "\n".join(generate(size * 10, anchor_density=0.1))
+    return lambda: MarkdownInjector(StringIO(text))
+
+
+@benchmark("utils.from_file", quick=(10_000, 100_000), full=(100_000, 1_000_000))
+def utils_from_file(size: int):
+    """Reads a slice of lines from the middle of a file."""
+    directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+    path = Path(directory.name) / "source.md"
+    write(path, size, anchor_density=1 / min(size, 1000))
+
+    def run():
+        return from_file(path, start=size // 2, end=size // 2 + 100)
+
+    # Cleaned up when the benchmark callable is discarded.
+    run.directory = directory
+    return run
+
+
+@benchmark(
+    "utils.sanitise_attribute", quick=(10_000, 100_000), full=(100_000, 1_000_000)
+)
+def utils_sanitise_attribute(size: int):
+    """Sanitises anchor names into attribute names."""
+    names = [f"Anchor Name {idx}-{idx % 7}" for idx in range(size)]
+    return lambda: [sanitise_attribute(name) for name in names]
+
+
+def _list_items(size: int) -> list[str]:
+    items = [f"List item {idx}." for idx in range(size)]
+    # One in a hundred items spans several lines.
+    items[::100] = [
+        f"List item\n    {idx}\n    continued." for idx in range(0, size, 100)
+    ]
+    return items
+
+
+@benchmark("utils.cleandoc", quick=(100_000,), full=(1_000_000,))
+def utils_cleandoc(size: int):
+    """Cleans up list items, mostly single line."""
+    items = _list_items(size)
+    return lambda: [cleandoc(item) for item in items]
+
+
+@benchmark("inspect.cleandoc", quick=(100_000,), full=(1_000_000,))
+def inspect_cleandoc(size: int):
+    """The standard library equivalent of `utils.cleandoc`, for comparison."""
+    items = _list_items(size)
+    return lambda: [inspect.cleandoc(item) for item in items]
+
+
+@benchmark("utils.list_item", quick=(100_000,), full=(1_000_000,))
+def utils_list_item(size: int):
+    """Renders list items."""
+    items = _list_items(size)
+    return lambda: [list_item(item) for item in items]
+
+
+def _build_cpu_section(number: int, section: MarkdownDocument):
+    for idx in range(2_000):
+        section.list(f"Item {number}.{idx}")
+
+
+@benchmark("document.sections", quick=(16,), full=(64,))
+def document_sections(size: int):
+    """Builds list heavy sections in a process pool."""
+
+    def run():
+        doc = MarkdownDocument()
+        doc.sections(
+            (f"Section {number}", partial(_build_cpu_section, number))
+            for number in range(size)
+        )
+        return doc
+
+    return run
+
+
+@benchmark("document.sections_serial", quick=(16,), full=(64,))
+def document_sections_serial(size: int):
+    """Builds the same sections as `document.sections` one after another."""
+
+    def run():
+        doc = MarkdownDocument()
+        for number in range(size):
+            doc.section(f"Section {number}", partial(_build_cpu_section, number))
+        return doc
+
+    return run
+
+
+def run_benchmarks(
+    preset: str = "quick",
+    repeat: int = 5,
+    pattern: Optional[str] = None,
+    sizes: Optional[tuple] = None,
+    memory: bool = True,
+) -> list[dict]:
+    """Runs the registered benchmarks.
+
+    Args:
+        preset (str, optional): Size preset, "quick" or "full". Defaults to "quick".
+        repeat (int, optional): Timings taken per benchmark. Defaults to 5.
+        pattern (Optional[str], optional): Regex benchmark names have to match.
+            Defaults to None.
+        sizes (Optional[tuple], optional): Sizes to use instead of the preset.
+            Defaults to None.
+        memory (bool, optional): Measure peak memory. Defaults to True.
+
+    Returns:
+        list[dict]: Result per benchmark and size.
+    """
+    results = []
+    for bench in BENCHMARKS:
+        if pattern and not re.search(pattern, bench.name):
+            continue
+        for size in sizes or bench.sizes[preset]:
+            result = {"name": bench.name, "size": size}
+            result.update(measure(bench.setup(size), repeat=repeat, memory=memory))
+            results.append(result)
+    return results
+
+
+def environment() -> dict:
+    """Describes the interpreter and machine the benchmarks ran on."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+
+
+def summary(results: list[dict]) -> MarkdownDocument:
+    """Renders benchmark results as a markdown document.
+
+    Args:
+        results (list[dict]): Results from `run_benchmarks`.
+
+    Returns:
+        MarkdownDocument: Summary document.
+    """
+    doc = MarkdownDocument()
+    with doc.heading("Benchmark Results"):
+        doc.paragraph(
+            ", ".join(f"{key}: {value}" for key, value in environment().items())
+        )
+        with doc.table(
+            titles=[
+                "Benchmark",
+                "Size",
+                "Median (ms)",
+                "IQR (ms)",
+                "Items/s",
+                "Peak Memory (MiB)",
+            ]
+        ) as table:
+            for result in results:
+                peak_memory = result["peak_memory"]
+                table.add_row(
+                    benchmark=result["name"],
+                    size=f"{result['size']:,}",
+                    median__ms_=f"{result['median'] * 1000:.2f}",
+                    iqr__ms_=f"{result['iqr'] * 1000:.2f}",
+                    items_s=f"{result['size'] / result['median']:,.0f}",
+                    peak_memory__mib_="-"
+                    if peak_memory is None
+                    else f"{peak_memory / 1024 / 1024:,.2f}",
+                )
+    return doc
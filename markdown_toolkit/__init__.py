@@ -1,6 +1,98 @@
-"""Markdown Toolkit."""
+"""Markdown Toolkit.
 
-from markdown_toolkit import constants
-from markdown_toolkit.document import MarkdownDocument
-from markdown_toolkit.injector import MarkdownInjector
-from markdown_toolkit.utils import *
+Submodules are imported on first attribute access, so importing the package only
+pays for the parts of it that are used.
+"""
+# __all__ re-exports the names in markdown_toolkit.utils.__all__.
+# pylint: disable=duplicate-code
+import os
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    # Declares the lazily imported names for type checkers and linters.
+    from markdown_toolkit import constants
+    from markdown_toolkit.cache import SectionCache
+    from markdown_toolkit.document import MarkdownDocument
+    from markdown_toolkit.injector import MarkdownInjector
+    from markdown_toolkit.utils import (
+        badge,
+        bold,
+        code,
+        from_file,
+        header,
+        image,
+        italic,
+        link,
+        quote,
+        strikethrough,
+    )
+
+__all__ = [
+    "MarkdownDocument",
+    "MarkdownInjector",
+    "SectionCache",
+    "badge",
+    "bold",
+    "code",
+    "constants",
+    "from_file",
+    "header",
+    "image",
+    "italic",
+    "link",
+    "quote",
+    "strikethrough",
+]
+
+_SUBMODULES = {
+    "bench",
+    "cache",
+    "constants",
+    "document",
+    "injector",
+    "instrumentation",
+    "profiling",
+    "sinks",
+    "utils",
+}
+
+_ATTRIBUTES = {
+    "MarkdownDocument": "document",
+    "MarkdownInjector": "injector",
+    "SectionCache": "cache",
+    "badge": "utils",
+    "bold": "utils",
+    "code": "utils",
+    "from_file": "utils",
+    "header": "utils",
+    "image": "utils",
+    "italic": "utils",
+    "link": "utils",
+    "quote": "utils",
+    "strikethrough": "utils",
+}
+
+
+def _import_submodule(name: str):
+    # __import__ rather than importlib, so the import shows up in -X importtime.
+    return __import__(f"{__name__}.{name}", fromlist=["__name__"])
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return _import_submodule(name)
+    if name not in _ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_submodule(_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
+
+
+if os.environ.get("MARKDOWN_TOOLKIT_PROFILE", "0") not in ("", "0"):
+    from markdown_toolkit.profiling import profile_process
+
+    profile_process()
@@ -0,0 +1,202 @@
+"""Markdown Toolkit benchmarking helpers.
+
+Measures callables, stores their timing and memory statistics, and compares
+two sets of results for regressions:
+
+```
+python -m markdown_toolkit.bench compare base.json head.json --threshold 0.1
+```
+"""
+from __future__ import annotations
+
+import json
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Union
+
+from markdown_toolkit.document import MarkdownDocument
+
+__all__ = ["compare", "comparison_document", "load_results", "measure", "quartiles"]
+
+
+def quartiles(values: list[float]) -> tuple[float, float, float]:
+    """Lower quartile, median and upper quartile with linear interpolation.
+
+    Args:
+        values (list[float]): Samples, at least one.
+
+    Returns:
+        tuple[float, float, float]: First quartile, median and third quartile.
+    """
+    ordered = sorted(values)
+    last = len(ordered) - 1
+
+    def percentile(fraction: float) -> float:
+        position = last * fraction
+        lower = int(position)
+        upper = min(lower + 1, last)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    return percentile(0.25), percentile(0.5), percentile(0.75)
+
+
+def measure(func: Callable[[], object], repeat: int = 5, memory: bool = True) -> dict:
+    """Times a callable and measures its peak memory allocation.
+
+    Memory is measured in an extra call under `tracemalloc`, so tracing doesn't
+    slow down the timed calls.
+
+    Args:
+        func (Callable[[], object]): Callable to measure.
+        repeat (int, optional): Timed calls. Defaults to 5.
+        memory (bool, optional): Measure peak memory. Defaults to True.
+
+    Returns:
+        dict: Timings, their median, quartiles and IQR, and peak memory in bytes.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+    lower, median, upper = quartiles(timings)
+    result = {
+        "timings": timings,
+        "min": min(timings),
+        "median": median,
+        "q1": lower,
+        "q3": upper,
+        "iqr": upper - lower,
+        "peak_memory": None,
+    }
+    if memory:
+        already_tracing = tracemalloc.is_tracing()
+        if not already_tracing:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, "reset_peak"):
+            # Python 3.9+, older versions report the peak since tracing started.
+            tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        if not already_tracing:
+            tracemalloc.stop()
+        result["peak_memory"] = peak - baseline
+    return result
+
+
+def load_results(path: Union[str, Path]) -> list[dict]:
+    """Loads results written by the benchmark suite.
+
+    Args:
+        path (Union[str, Path]): JSON results file.
+
+    Returns:
+        list[dict]: Benchmark results.
+    """
+    with open(path, "r", encoding="UTF-8") as file:
+        return json.load(file)["results"]
+
+
+def compare(base: list[dict], head: list[dict], threshold: float = 0.05) -> list[dict]:
+    """Compares two sets of benchmark results.
+
+    A benchmark is only flagged as a regression (or improvement) when its median
+    moves by more than the threshold and the interquartile ranges of the two runs
+    don't overlap, so noisy benchmarks need a clear shift to be flagged. Peak memory
+    is flagged when it moves by more than the threshold.
+
+    Args:
+        base (list[dict]): Baseline results.
+        head (list[dict]): Results to compare against the baseline.
+        threshold (float, optional): Relative change to ignore. Defaults to 0.05.
+
+    Returns:
+        list[dict]: Comparison per benchmark found in both sets of results.
+    """
+    baseline = {(result["name"], result["size"]): result for result in base}
+    comparisons = []
+    for result in head:
+        previous = baseline.get((result["name"], result["size"]))
+        if previous is None:
+            continue
+        change = result["median"] / previous["median"] - 1
+        status = "unchanged"
+        if change > threshold and result["q1"] > previous["q3"]:
+            status = "regression"
+        elif change < -threshold and result["q3"] < previous["q1"]:
+            status = "improvement"
+        memory_change = None
+        if previous.get("peak_memory") and result.get("peak_memory") is not None:
+            memory_change = result["peak_memory"] / previous["peak_memory"] - 1
+            if memory_change > threshold and status == "unchanged":
+                status = "memory regression"
+        comparisons.append(
+            {
+                "name": result["name"],
+                "size": result["size"],
+                "base_median": previous["median"],
+                "head_median": result["median"],
+                "change": change,
+                "base_peak_memory": previous.get("peak_memory"),
+                "head_peak_memory": result.get("peak_memory"),
+                "memory_change": memory_change,
+                "status": status,
+            }
+        )
+    return comparisons
+
+
+def _memory(size: Union[int, None]) -> str:
+    if size is None:
+        return "-"
+    return f"{size / 1024 / 1024:,.2f} MiB"
+
+
+def comparison_document(comparisons: list[dict], threshold: float) -> MarkdownDocument:
+    """Renders a comparison as a markdown table, ready to paste into a pull request.
+
+    Args:
+        comparisons (list[dict]): Output of `compare`.
+        threshold (float): Threshold the comparison used.
+
+    Returns:
+        MarkdownDocument: Comparison document.
+    """
+    regressions = [
+        comparison
+        for comparison in comparisons
+        if comparison["status"] in ("regression", "memory regression")
+    ]
+    doc = MarkdownDocument()
+    with doc.heading("Benchmark Comparison"):
+        doc.paragraph(
+            f"{len(regressions)} regression(s) in {len(comparisons)} benchmarks, "
+            f"threshold {threshold:.0%}."
+        )
+        with doc.table(
+            titles=[
+                "Benchmark",
+                "Size",
+                "Base (ms)",
+                "Head (ms)",
+                "Change",
+                "Base Memory",
+                "Head Memory",
+                "Status",
+            ]
+        ) as table:
+            for comparison in comparisons:
+                status = comparison["status"]
+                table.add_row(
+                    benchmark=comparison["name"],
+                    size=f"{comparison['size']:,}",
+                    base__ms_=f"{comparison['base_median'] * 1000:.2f}",
+                    head__ms_=f"{comparison['head_median'] * 1000:.2f}",
+                    change=f"{comparison['change']:+.1%}",
+                    base_memory=_memory(comparison["base_peak_memory"]),
+                    head_memory=_memory(comparison["head_peak_memory"]),
+                    status=f"**{status}**" if "regression" in status else status,
+                )
+    return doc
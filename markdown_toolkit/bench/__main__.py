@@ -0,0 +1,44 @@
+"""Benchmark comparison command line interface."""
+import argparse
+import sys
+
+from markdown_toolkit.bench import compare, comparison_document, load_results
+
+
+def main(argv=None) -> int:
+    """Compares two benchmark result files and prints a markdown report.
+
+    Returns:
+        int: Exit code, 1 if regressions were found and `--fail` was passed.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m markdown_toolkit.bench",
+        description="Markdown Toolkit benchmark tools.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    compare_parser = commands.add_parser(
+        "compare", help="Compare two benchmark result files."
+    )
+    compare_parser.add_argument("base", help="Baseline JSON results.")
+    compare_parser.add_argument("head", help="JSON results to compare.")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="Relative change to tolerate, defaults to 0.05.",
+    )
+    compare_parser.add_argument(
+        "--fail", action="store_true", help="Exit with 1 when regressions are found."
+    )
+    args = parser.parse_args(argv)
+
+    comparisons = compare(
+        load_results(args.base), load_results(args.head), threshold=args.threshold
+    )
+    print(comparison_document(comparisons, args.threshold).render())
+    regressed = any("regression" in comparison["status"] for comparison in comparisons)
+    return 1 if args.fail and regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""Synthetic markdown workloads.
+
+Generates deterministic markdown documents shaped like real ones (headings,
+paragraphs, nested lists, tables and injector anchors) for benchmarks and
+scaling tests. Documents are generated a line at a time, so very large
+fixtures can be streamed straight to disk:
+
+```
+python -m markdown_toolkit.bench.workloads fixture.md --lines 20000000
+```
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+from pathlib import Path
+from typing import Iterator, Union
+
+from markdown_toolkit.utils import header, list_item
+
+__all__ = ["generate", "write"]
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua enim ad minim veniam quis nostrud "
+    "exercitation ullamco laboris nisi aliquip ex ea commodo consequat duis aute "
+    "irure in reprehenderit voluptate velit esse cillum eu fugiat nulla pariatur"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(WORDS, k=words)).capitalize() + "."
+
+
+def _heading(rng: random.Random, heading_depth: int) -> list[str]:
+    level = rng.randint(1, heading_depth)
+    return [header(_sentence(rng, 3)[:-1], level), ""]
+
+
+def _paragraph(rng: random.Random) -> list[str]:
+    lines = [_sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(1, 4))]
+    return lines + [""]
+
+
+def _list(rng: random.Random, list_depth: int) -> list[str]:
+    lines = []
+    ordered = rng.random() < 0.3
+    depth = 0
+    for _ in range(rng.randint(3, 12)):
+        lines.append(
+            " " * 4 * depth + list_item(_sentence(rng, rng.randint(2, 6)), ordered)
+        )
+        depth = rng.randint(0, min(depth + 1, list_depth - 1))
+    return lines + [""]
+
+
+def _table(rng: random.Random, rows: int, columns: int) -> list[str]:
+    lines = [
+        "| " + " | ".join(f"Column {idx}" for idx in range(columns)) + " |",
+        "| " + " | ".join("---" for _ in range(columns)) + " |",
+    ]
+    for _ in range(rng.randint(1, rows)):
+        cells = rng.choices(WORDS, k=columns)
+        cells[1::2] = [str(int(rng.random() * 10_000)) for _ in cells[1::2]]
+        lines.append("| " + " | ".join(cells) + " |")
+    return lines + [""]
+
+
+def _anchor(rng: random.Random, name: str, anchor_nesting: int) -> list[str]:
+    indent = " " * 4 * rng.randint(0, anchor_nesting)
+    tag = f"{indent}<!--- markdown-toolkit:{name} --->"
+    body = [indent + _sentence(rng, 6) for _ in range(rng.randint(0, 3))]
+    return [tag] + body + [tag]
+
+
+def generate(
+    lines: int,
+    *,
+    seed: int = 0,
+    anchor_density: float = 0.001,
+    anchor_nesting: int = 0,
+    heading_depth: int = 4,
+    list_depth: int = 4,
+    table_rows: int = 50,
+    table_columns: int = 6,
+) -> Iterator[str]:
+    """Yields the lines of a synthetic markdown document.
+
+    The same arguments always produce the same document. Anchors are named
+    `anchor0`, `anchor1` and so on, in document order, and never overlap.
+
+    Args:
+        lines (int): Lines to generate.
+        seed (int, optional): Random seed. Defaults to 0.
+        anchor_density (float, optional): Anchor pairs per line of document.
+            Defaults to 0.001, a pair every thousand lines.
+        anchor_nesting (int, optional): Maximum indent level of anchors, as found
+            inside nested lists. Defaults to 0.
+        heading_depth (int, optional): Deepest heading level. Defaults to 4.
+        list_depth (int, optional): Deepest list nesting. Defaults to 4.
+        table_rows (int, optional): Maximum rows per table. Defaults to 50.
+        table_columns (int, optional): Columns per table. Defaults to 6.
+
+    Yields:
+        str: Document line.
+    """
+    rng = random.Random(seed)
+    anchor_every = 1 / anchor_density if anchor_density else float("inf")
+    next_anchor = anchor_every / 2
+    anchors = itertools.count()
+    produced = 0
+    while produced < lines:
+        if produced >= next_anchor:
+            block = _anchor(rng, f"anchor{next(anchors)}", anchor_nesting)
+            next_anchor += anchor_every
+            if len(block) > lines - produced:
+                block = [""] * (lines - produced)
+        else:
+            kind = rng.random()
+            if kind < 0.1:
+                block = _heading(rng, heading_depth)
+            elif kind < 0.55:
+                block = _paragraph(rng)
+            elif kind < 0.85:
+                block = _list(rng, list_depth)
+            else:
+                block = _table(rng, table_rows, table_columns)
+            block = block[: lines - produced]
+        produced += len(block)
+        yield from block
+
+
+def write(
+    path: Union[str, Path], lines: int, *, chunk_size: int = 10_000, **options
+) -> Path:
+    """Streams a synthetic markdown document to a file.
+
+    Args:
+        path (Union[str, Path]): File to write.
+        lines (int): Lines to generate.
+        chunk_size (int, optional): Lines written at a time. Defaults to 10,000.
+        **options: Passed to `generate`.
+
+    Returns:
+        Path: Path of the written file.
+    """
+    path = Path(path)
+    document = generate(lines, **options)
+    with open(path, "w", encoding="UTF-8") as file:
+        chunk = list(itertools.islice(document, chunk_size))
+        while chunk:
+            file.writelines(line + "\n" for line in chunk)
+            chunk = list(itertools.islice(document, chunk_size))
+    return path
+
+
+def main(argv=None):
+    """Writes a synthetic markdown document from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m markdown_toolkit.bench.workloads",
+        description="Generate a synthetic markdown document.",
+    )
+    parser.add_argument("path", help="File to write.")
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--anchor-density", type=float, default=0.001)
+    parser.add_argument("--anchor-nesting", type=int, default=0)
+    parser.add_argument("--heading-depth", type=int, default=4)
+    parser.add_argument("--list-depth", type=int, default=4)
+    parser.add_argument("--table-rows", type=int, default=50)
+    parser.add_argument("--table-columns", type=int, default=6)
+    options = vars(parser.parse_args(argv))
+    write(options.pop("path"), options.pop("lines"), **options)
+
+
+if __name__ == "__main__":
+    main()
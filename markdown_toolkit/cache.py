@@ -0,0 +1,189 @@
+"""Markdown Toolkit section cache."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+from functools import partial
+from pathlib import Path
+from types import CodeType, FunctionType
+from typing import Callable, Optional, Union
+
+from markdown_toolkit.document import MarkdownDocument, _HeadingLine
+
+
+def _canonical_repr(value) -> str:  # pylint: disable=too-many-return-statements
+    """Representation of a builder or its arguments that is stable across processes.
+
+    Functions are represented by their name, bytecode, constants, names and default
+    arguments, and sets are sorted, as their ordering depends on the hash seed.
+    """
+    if isinstance(value, partial):
+        keywords = sorted(
+            (key, _canonical_repr(item)) for key, item in value.keywords.items()
+        )
+        arguments = [_canonical_repr(item) for item in value.args]
+        return repr(("partial", _canonical_repr(value.func), arguments, keywords))
+    if isinstance(value, FunctionType):
+        return repr(
+            (
+                value.__module__,
+                value.__qualname__,
+                _canonical_repr(value.__code__),
+                _canonical_repr(value.__defaults__),
+                _canonical_repr(value.__kwdefaults__),
+            )
+        )
+    if isinstance(value, CodeType):
+        constants = [_canonical_repr(item) for item in value.co_consts]
+        return repr((value.co_code, value.co_names, constants))
+    if isinstance(value, (set, frozenset)):
+        items = sorted(_canonical_repr(item) for item in value)
+        return repr((type(value).__name__, items))
+    if isinstance(value, dict):
+        items = sorted(
+            (_canonical_repr(key), _canonical_repr(item)) for key, item in value.items()
+        )
+        return repr((type(value).__name__, items))
+    if isinstance(value, (list, tuple)):
+        return repr((type(value).__name__, [_canonical_repr(item) for item in value]))
+    if value is None or isinstance(value, (str, bytes, int, float, complex)):
+        return repr(value)
+    return pickle.dumps(value, protocol=4).hex()
+
+
+class SectionCache:
+    """On disk cache of built document sections.
+
+    Sections are stored as JSON files named by a hash of their inputs, so
+    regenerating a document only rebuilds the sections whose inputs changed.
+
+    ```python
+    cache = SectionCache(".markdown-cache")
+    for account in accounts:
+        doc.section(
+            account["name"], functools.partial(build_account, account), cache=cache
+        )
+    print(cache.stats())
+    ```
+
+    Args:
+        path (Union[str, Path]): Cache directory.
+        version (str, optional): Salt mixed into every key, change it to invalidate
+            sections whose inputs the key can not see. Defaults to "".
+    """
+
+    def __init__(self, path: Union[str, Path], version: str = ""):
+        self.path = Path(path)
+        self.version = version
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def key(self, builder: Callable[[MarkdownDocument], None]) -> str:
+        """Hashes a section builder and its bound arguments into a cache key.
+
+        The builder is hashed with any `functools.partial` arguments, the cache
+        version, and the bytecode, constants, names and default arguments of the
+        underlying function, so changing any of them invalidates the section. Keys
+        are the same in every process, whatever the hash seed. Functions called by
+        the builder are only hashed by name, so changes to them need a new `version`.
+
+        Args:
+            builder (Callable[[MarkdownDocument], None]): Section builder.
+
+        Raises:
+            ValueError: Builder or its arguments can not be pickled.
+
+        Returns:
+            str: Cache key.
+        """
+        try:
+            # Builders that can't be pickled, such as lambdas, can't be named either.
+            pickle.dumps(builder, protocol=4)
+            canonical = _canonical_repr(builder)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            raise ValueError(
+                "Section builder can not be hashed, pass an explicit key."
+            ) from error
+        digest = hashlib.sha256(canonical.encode())
+        digest.update(self.version.encode())
+        return digest.hexdigest()
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[MarkdownDocument]:
+        """Loads a cached section, counting the hit or miss.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[MarkdownDocument]: Cached section, or None if not cached.
+        """
+        try:
+            with open(self._file(key), "r", encoding="UTF-8") as file:
+                lines = json.load(file)
+        except (FileNotFoundError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        document = MarkdownDocument()
+        document._buffer = [  # pylint: disable=protected-access
+            line if isinstance(line, str) else _HeadingLine(*line) for line in lines
+        ]
+        return document
+
+    def set(self, key: str, document: MarkdownDocument):
+        """Stores a built section.
+
+        Args:
+            key (str): Cache key.
+            document (MarkdownDocument): Built section.
+        """
+        lines = [
+            [line.heading, line.level] if isinstance(line, _HeadingLine) else line
+            for line in document._lines()  # pylint: disable=protected-access
+        ]
+        file = self._file(key)
+        temporary_file = file.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary_file, "w", encoding="UTF-8") as file_object:
+            json.dump(lines, file_object)
+        os.replace(temporary_file, file)
+
+    def build(
+        self,
+        builder: Callable[[MarkdownDocument], None],
+        key: Optional[str] = None,
+    ) -> MarkdownDocument:
+        """Returns a cached section, building and storing it on a miss.
+
+        Args:
+            builder (Callable[[MarkdownDocument], None]): Section builder.
+            key (Optional[str], optional): Cache key. Defaults to a hash of the builder.
+
+        Returns:
+            MarkdownDocument: Section document.
+        """
+        key = key or self.key(builder)
+        document = self.get(key)
+        if document is None:
+            document = MarkdownDocument()
+            builder(document)
+            self.set(key, document)
+        return document
+
+    def stats(self) -> dict:
+        """Cache hit and miss statistics.
+
+        Returns:
+            dict: Hits, misses and hit ratio.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,22 +1,133 @@
 """Markdown Toolkit main classes."""
+# Heavy imports are deferred to first use to keep import time down.
+# pylint: disable=import-outside-toplevel,too-many-lines
 from __future__ import annotations
 
 import itertools
+import os
+from collections.abc import Mapping, Sequence
 from contextlib import contextmanager
-from inspect import cleandoc
 from io import StringIO
-from typing import Optional, Union
 
+from markdown_toolkit.instrumentation import instrument
 from markdown_toolkit.utils import (
+    bold,
+    cleandoc,
     fileobj_open,
     header,
+    link,
     list_item,
     remove_duplicates,
     sanitise_attribute,
 )
 
+# Avoids importing typing at runtime, annotations are only evaluated by type checkers.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
+    from pathlib import Path
+    from typing import (
+        Any,
+        Awaitable,
+        BinaryIO,
+        Callable,
+        Iterable,
+        Iterator,
+        Optional,
+        TextIO,
+        Union,
+    )
+
+    from markdown_toolkit.cache import SectionCache
+    from markdown_toolkit.instrumentation import Instrumentation
+
+# Called with every new document, used by profiling to count the lines produced.
+_DOCUMENT_HOOKS: list[Callable[[MarkdownDocument], None]] = []
+
+
+class _HeadingLine(str):
+    """Rendered heading that remembers its text and level.
+
+    Lets headings be shifted when the document they belong to is included in another.
+    """
+
+    def __new__(cls, heading: str, level: int):
+        line = super().__new__(cls, header(heading, level))
+        line.heading = heading
+        line.level = level
+        return line
+
+    def __getnewargs__(self):
+        return (self.heading, self.level)
+
+
+class _Aggregate:
+    """Running count, sum, minimum and maximum of a table column.
 
-class MarkdownDocument:
+    Values are parsed as numbers once, as they are added. Empty cells are skipped,
+    and cells that aren't numbers only count towards `count`.
+    """
+
+    FUNCTIONS = ("count", "sum", "min", "max", "mean")
+
+    __slots__ = (
+        "functions",
+        "numeric",
+        "count",
+        "numbers",
+        "total",
+        "minimum",
+        "maximum",
+    )
+
+    def __init__(self, functions: list[str]):
+        self.functions = functions
+        self.numeric = any(function != "count" for function in functions)
+        self.count = 0
+        self.numbers = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value: Any):
+        """Adds a cell value."""
+        if value is None or value == "":
+            return
+        self.count += 1
+        if not self.numeric:
+            return
+        if not isinstance(value, (int, float)):
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    return
+        self.numbers += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def result(self, function: str) -> Any:
+        """Value of an aggregate function, None if there were no numbers."""
+        if function == "count":
+            return self.count
+        if not self.numbers:
+            return None
+        if function == "sum":
+            return self.total
+        if function == "min":
+            return self.minimum
+        if function == "max":
+            return self.maximum
+        return self.total / self.numbers
+
+
+class MarkdownDocument:  # pylint: disable=too-many-public-methods
     """Markdown document builder class.
 
     The purpose of this class is to generate markdown programatically with an
@@ -31,6 +142,8 @@ class MarkdownDocument:
     """
 
     class _MarkdownList:
+        __slots__ = ("doc",)
+
         def __init__(
             self,
             item: str,
@@ -49,29 +162,163 @@ class MarkdownDocument:
             self.doc._indent_level -= 1
             self.doc._list_level -= 1
 
-    class _MarkdownTable:
+    class _MarkdownTable:  # pylint: disable=too-many-instance-attributes
         """Table renderer."""
 
-        def __init__(
+        __slots__ = (
+            "doc",
+            "titles",
+            "normalized_titles",
+            "column_count",
+            "rows",
+            "sort_by",
+            "page_size",
+            "paginate",
+            "where",
+            "sinks",
+            "truncate",
+            "row_count",
+            "_paged_rows",
+            "_formatters",
+            "_convert",
+            "_values",
+            "_aggregates",
+            "_seen",
+            "_blake2b",
+            "_unique_indexes",
+            "_plain",
+            "_spill_file",
+            "_spill_spans",
+            "_instrumentation",
+        )
+
+        def __init__(  # pylint: disable=too-many-arguments,too-many-locals
             self,
             document: MarkdownDocument,
             titles: list,
             sort_by: Optional[str] = None,
+            *,
+            columns: Optional[list] = None,
+            where: Optional[Callable[[dict], bool]] = None,
+            formatters: Optional[dict[str, Callable[[Any], str]]] = None,
+            aggregates: Optional[dict[str, Union[str, list[str]]]] = None,
+            unique_on: Optional[list] = None,
+            page_size: Optional[int] = None,
+            paginate: str = "split",
+            sinks: Optional[list] = None,
+            truncate: Optional[int] = None,
         ):
+            if columns is not None and len(columns) != len(titles):
+                raise ValueError("Columns and titles must be the same length.")
             self.doc = document
             self.titles = titles
             self.normalized_titles = list(map(sanitise_attribute, titles))
             self.column_count = len(self.normalized_titles)
             self.rows = []
             self.sort_by = titles.index(sort_by) if sort_by else None
-
-        def bulk_add_rows(self, rows: list[dict]):
-            """Bulk add rows from a list of dicts."""
+            if page_size is not None:
+                if page_size < 1:
+                    raise ValueError("Page size must be at least 1.")
+                if self.sort_by is not None:
+                    raise ValueError("Sorted tables can't be paginated.")
+                if paginate not in ("collapsed", "split"):
+                    raise ValueError('Paginate must be "collapsed" or "split".')
+            self.page_size = page_size
+            self.paginate = paginate
+            self._paged_rows = 0
+            self.where = where
+            formatters = formatters or {}
+            if not set(formatters).issubset(titles):
+                raise ValueError("Formatter column not found in headers.")
+            self._formatters = [formatters.get(title, str) for title in titles]
+            keys = columns or titles
+            self._convert = _row_converter(keys, self._formatters)
+            self._values = _row_converter(keys, [None] * len(keys))
+            self._aggregates = self._aggregate_columns(aggregates)
+            self._seen: Optional[set[bytes]] = None
+            if unique_on is not None:
+                from hashlib import blake2b
+
+                if not set(unique_on).issubset(titles):
+                    raise ValueError("Unique column not found in headers.")
+                self._seen = set()
+                self._blake2b = blake2b
+                self._unique_indexes = [titles.index(title) for title in unique_on]
+            self.sinks = sinks or []
+            for sink in self.sinks:
+                sink.start(titles)
+            self.truncate = truncate
+            self.row_count = 0
+            self._plain = not (
+                self._aggregates
+                or unique_on is not None
+                or page_size is not None
+                or sinks
+                or truncate is not None
+            )
+            self._spill_file = None
+            self._spill_spans: list[tuple[BinaryIO, int, int]] = []
+            if document._instrumentation is not None:
+                instrument(
+                    self,
+                    document._instrumentation,
+                    ("add_row", "bulk_add_rows", "_render"),
+                )
+
+        def _aggregate_columns(
+            self, aggregates: Optional[dict[str, Union[str, list[str]]]]
+        ) -> list[tuple[int, _Aggregate]]:
+            """Column index and accumulator of each aggregated column."""
+            aggregated = []
+            for title, functions in (aggregates or {}).items():
+                if title not in self.titles:
+                    raise ValueError("Aggregate column not found in headers.")
+                if isinstance(functions, str):
+                    functions = [functions]
+                if not set(functions).issubset(_Aggregate.FUNCTIONS):
+                    raise ValueError(
+                        f"Aggregates must be one of {', '.join(_Aggregate.FUNCTIONS)}."
+                    )
+                aggregated.append((self.titles.index(title), _Aggregate(functions)))
+            return aggregated
+
+        def bulk_add_rows(self, rows: Iterable[dict]):
+            """Bulk add rows from an iterable of dicts."""
+            if self.where is not None:
+                rows = filter(self.where, rows)
+            if self._plain:
+                self.rows.extend(map(self._convert, rows))
+                return
+            convert = self._convert
+            values = self._values if self._aggregates or self.sinks else None
             for row in rows:
-                row_buffer = []
-                for title in self.titles:
-                    row_buffer.append(str(row[title]))
-                self.rows.append(row_buffer)
+                self._add(convert(row), values and values(row))
+
+        def _add(self, cells: list[str], values: Optional[list]):
+            """Adds a row, with its raw values for aggregates and sinks."""
+            if self._seen is not None and not self._first_occurrence(cells):
+                return
+            self.row_count += 1
+            if self.truncate is None or self.row_count <= self.truncate:
+                self.rows.append(cells)
+            for idx, aggregate in self._aggregates:
+                aggregate.add(values[idx])
+            for sink in self.sinks:
+                sink.write(values)
+            if self.page_size is not None and len(self.rows) > self.page_size:
+                self._write_page()
+
+        def _first_occurrence(self, cells: list[str]) -> bool:
+            """Records the digest of a row's unique columns, False if already seen.
+
+            Only 16 byte digests are kept, rather than a second copy of every row.
+            """
+            key = "\x1f".join([cells[idx] for idx in self._unique_indexes])
+            digest = self._blake2b(key.encode(), digest_size=16).digest()
+            if digest in self._seen:
+                return False
+            self._seen.add(digest)
+            return True
 
         def add_row(self, **columns):
             """Add row to table helper."""
@@ -81,32 +328,134 @@ class MarkdownDocument:
                 if column not in self.normalized_titles:
                     raise ValueError("Column not found in headers.")
             row_buffer = []
-            for title in self.normalized_titles:
-                row_buffer.append(str(columns.get(title, "")))
-            self.rows.append(row_buffer)
+            for title, formatter in zip(self.normalized_titles, self._formatters):
+                row_buffer.append(formatter(columns[title]) if title in columns else "")
+            if self._plain:
+                self.rows.append(row_buffer)
+            else:
+                self._add(row_buffer, list(map(columns.get, self.normalized_titles)))
 
-        def _render(self):
-            buffer = []
-            buffer.append("| " + " | ".join(self.titles) + " |")
-            buffer.append(
-                "| " + " | ".join(["---" for _ in range(self.column_count)]) + " |"
+        def spill(self, file: Optional[BinaryIO] = None):
+            """Moves the rows added so far to a temporary file, to bound memory use.
+
+            Args:
+                file (Optional[BinaryIO], optional): Binary file to append the rows
+                    to, which can be shared by several tables and is left open.
+                    Defaults to a temporary file of the table's own, closed once
+                    the table is rendered.
+
+            Raises:
+                ValueError: If the table is sorted, which needs all rows in memory.
+            """
+            if self.sort_by is not None:
+                raise ValueError("Sorted tables can't be spilled to disk.")
+            if file is None:
+                if self._spill_file is None:
+                    import tempfile
+
+                    self._spill_file = tempfile.TemporaryFile()
+                file = self._spill_file
+            start = file.seek(0, os.SEEK_END)
+            file.write(
+                "".join("| " + " | ".join(row) + " |\n" for row in self.rows).encode(
+                    "UTF-8"
+                )
             )
-            if self.sort_by:
+            self._spill_spans.append((file, start, file.tell()))
+            self.rows = []
+
+        def _header(self) -> list[str]:
+            return [
+                "| " + " | ".join(self.titles) + " |",
+                "| " + " | ".join(["---" for _ in range(self.column_count)]) + " |",
+            ]
+
+        def _write_page(self, final: bool = False):
+            """Adds the next page of rows to the document, as its own table.
+
+            A row is held back until the final page, so the footer is never alone.
+            """
+            if final:
+                rows = len(self.rows)
+                table = self._render()
+            else:
+                rows = self.page_size
+                buffer = self._header()
+                for row in self.rows[:rows]:
+                    buffer.append("| " + " | ".join(row) + " |")
+                del self.rows[:rows]
+                table = "\n".join(buffer)
+            first = self._paged_rows + 1
+            self._paged_rows += rows
+            if self.paginate == "collapsed" and rows:
+                with self.doc.collapsed(f"Rows {first:,} to {self._paged_rows:,}"):
+                    self.doc.paragraph(table)
+            else:
+                self.doc.paragraph(table)
+
+        def _render(self):
+            buffer = self._header()
+            for file, start, end in self._spill_spans:
+                file.seek(start)
+                buffer.extend(file.read(end - start).decode("UTF-8").split("\n")[:-1])
+            self._spill_spans = []
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+            if self.sort_by is not None:
                 self.rows.sort(key=lambda x: x[self.sort_by])
             for row in self.rows:
                 buffer.append("| " + " | ".join(row) + " |")
+            for row in self._footer():
+                buffer.append("| " + " | ".join(row) + " |")
 
             return "\n".join(buffer)
 
+        def _footer(self) -> list[list[str]]:
+            """Row per aggregate function, labelled in the first column."""
+            footer = []
+            for function in _Aggregate.FUNCTIONS:
+                row = None
+                for idx, aggregate in self._aggregates:
+                    if function not in aggregate.functions:
+                        continue
+                    if row is None:
+                        row = [""] * self.column_count
+                        row[0] = bold(function.title())
+                    value = aggregate.result(function)
+                    if value is None:
+                        continue
+                    if function == "count":
+                        cell = str(value)
+                    else:
+                        cell = self._formatters[idx](value)
+                    # The first column keeps its label, e.g. "**Count**: 3".
+                    row[idx] = f"{row[0]}: {cell}" if idx == 0 else cell
+                if row is not None:
+                    footer.append(row)
+            return footer
+
         def __enter__(self):
             return self
 
         def __exit__(self, exc_type, exc_value, exc_traceback):
-            self.doc.paragraph(self._render())
+            if self.page_size is None:
+                self.doc.paragraph(self._render())
+            else:
+                self._write_page(final=True)
+            if self.truncate is not None and self.row_count > self.truncate:
+                note = f"Showing {self.truncate:,} of {self.row_count:,} rows."
+                urls = [getattr(sink, "url", None) for sink in self.sinks]
+                urls = [url for url in urls if url]
+                if urls:
+                    note += " Full data: " + ", ".join(map(link, urls))
+                self.doc.paragraph(note)
 
     class _MarkdownHeading:
         """Heading context manager."""
 
+        __slots__ = ("doc", "heading", "silent", "level")
+
         def __init__(
             self,
             document: MarkdownDocument,
@@ -121,7 +470,9 @@ class MarkdownDocument:
 
         def __enter__(self):
             if not self.silent:
-                self.doc._buffer.append(self.__str__())
+                self.doc._buffer.append(
+                    _HeadingLine(self.heading, self.level or self.doc._heading_level)
+                )
                 self.doc.linebreak()
             if not self.level:
                 self.doc._heading_level += 1
@@ -141,12 +492,51 @@ class MarkdownDocument:
             level = self.level or self.doc._heading_level
             return header(self.heading, level)
 
-    def __init__(self, newline_character: str = "\n"):
-        self._buffer: list[str] = []
+    class _MarkdownInclude:  # pylint: disable=too-few-public-methods
+        """Reference to another document, expanded when rendered."""
+
+        __slots__ = ("document", "indent", "heading_offset")
+
+        def __init__(
+            self, document: MarkdownDocument, indent: str, heading_offset: int
+        ):
+            self.document = document
+            self.indent = indent
+            self.heading_offset = heading_offset
+
+    def __init__(
+        self,
+        newline_character: str = "\n",
+        instrumentation: Optional[Instrumentation] = None,
+    ):
+        self._buffer: list[Union[str, MarkdownDocument._MarkdownInclude]] = []
+        self._has_includes: bool = False
         self._indent_level: int = -1
         self._list_level: int = -1
         self._heading_level = 1
         self._newline_character: str = newline_character
+        self._instrumentation: Optional[Instrumentation] = None
+        if instrumentation is not None:
+            instrument(self, instrumentation, ("text", "paragraph", "render"))
+        for hook in _DOCUMENT_HOOKS:
+            hook(self)
+
+    def stats(self) -> dict:
+        """Instrumentation statistics, if the document was created with instrumentation.
+
+        ```python
+        doc = MarkdownDocument(instrumentation=Instrumentation())
+        doc.paragraph("Example")
+        doc.stats()["MarkdownDocument.paragraph"]["calls"]
+        ```
+
+        Returns:
+            dict: Calls and cumulative seconds per instrumented method, including
+                tables in this document.
+        """
+        if self._instrumentation is None:
+            return {}
+        return self._instrumentation.stats()
 
     @property
     def _in_list(self) -> bool:
@@ -215,12 +605,22 @@ class MarkdownDocument:
 
         return self._MarkdownHeading(self, heading=heading, silent=silent, level=level)
 
-    def table(
+    def table(  # pylint: disable=too-many-arguments,too-many-locals
         self,
-        raw_table: Optional[list[dict]] = None,
+        raw_table: Optional[Iterable[dict]] = None,
         *,
         titles: Optional[list] = None,
         sort_by: Optional[str] = None,
+        columns: Optional[list] = None,
+        where: Optional[Callable[[dict], bool]] = None,
+        formatters: Optional[dict[str, Callable[[Any], str]]] = None,
+        aggregates: Optional[dict[str, Union[str, list[str]]]] = None,
+        unique: bool = False,
+        unique_on: Optional[list] = None,
+        page_size: Optional[int] = None,
+        paginate: str = "split",
+        sinks: Optional[list] = None,
+        truncate: Optional[int] = None,
     ) -> _MarkdownTable:
         """Adds a Markdown Table to the document.
 
@@ -252,23 +652,456 @@ class MarkdownDocument:
             )
             ```
 
+        Rows can be narrowed down to some of their `columns`, filtered with a `where`
+        predicate and have their cells rendered by per title `formatters`, instead of
+        `str`. With `columns` the rows aren't scanned for titles first, so any
+        iterable of rows can be streamed into the table (without them, the titles are
+        the keys of the rows and iterators are read into a list first):
+
+        ```python
+        doc.table(
+            rows,
+            columns=["account", "cost"],
+            titles=["Account", "Cost"],
+            where=lambda row: row["cost"] > 0,
+            formatters={"Account": code, "Cost": "${:,.2f}".format},
+        )
+        ```
+
+        Totals and other `aggregates` of columns are accumulated as rows are added,
+        and rendered as footer rows, one per aggregate function:
+
+        ```python
+        doc.table(rows, aggregates={"Account": "count", "Cost": ["sum", "mean"]})
+        ```
+
+        Duplicate rows are dropped as they are added with `unique`, or rows with
+        duplicate values in the `unique_on` titles, keeping the first occurrence.
+        Only a 16 byte digest of each row is kept to find the duplicates.
+
+        Large tables can be split into pages of `page_size` rows, each its own table
+        (`paginate="split"`) or in a collapsed section (`paginate="collapsed"`).
+        Pages are added to the document as soon as they are full, so the rows of the
+        whole table are never held at once.
+
+        Rows can also be written to `sinks`, such as `sinks.CSVSink`, in the same
+        pass, with the markdown table `truncate`d to its first rows and a link to the
+        full data at the `url` of each sink:
+
+        ```python
+        with CSVSink("costs.csv") as sink:
+            doc.table(rows, sinks=[sink], truncate=100)
+        ```
+
         Args:
-            raw_table (Optional[list[dict]], optional): Raw table to render. Defaults to None.
-            titles (Optional[list], optional): Table titles. Defaults to None.
+            raw_table (Optional[Iterable[dict]], optional): Raw table to render.
+                Defaults to None.
+            titles (Optional[list], optional): Table titles, ignored for a raw table
+                without `columns`, whose titles are its keys. Defaults to None.
             sort_by (Optional[str], optional): Table title to sort by. Defaults to None.
+            columns (Optional[list], optional): Row keys to render, in order, one per
+                title. Defaults to None, the titles.
+            where (Optional[Callable[[dict], bool]], optional): Predicate rows added
+                in bulk have to pass. Defaults to None.
+            formatters (Optional[dict[str, Callable[[Any], str]]], optional): Cell
+                formatter per table title. Defaults to None, `str`.
+            aggregates (Optional[dict[str, Union[str, list[str]]]], optional):
+                Aggregate functions per table title, any of "count", "sum", "min",
+                "max" and "mean". Defaults to None.
+            unique (bool, optional): Drop duplicate rows. Defaults to False.
+            unique_on (Optional[list], optional): Titles of the columns identifying
+                duplicate rows, implies `unique`. Defaults to None, all columns.
+            page_size (Optional[int], optional): Rows per page, at least 1, can't be
+                combined with `sort_by`. Defaults to None, a single table.
+            paginate (str, optional): Either "split" or "collapsed".
+                Defaults to "split".
+            sinks (Optional[list], optional): Sinks every row is written to, with
+                `start(titles)` and `write(values)` methods. Defaults to None.
+            truncate (Optional[int], optional): Rows to render, the rest only go to
+                sinks and aggregates. Defaults to None, all rows.
 
         Returns:
             _MarkdownTable: Object with helper methods.
         """
+        options = {
+            "sort_by": sort_by,
+            "where": where,
+            "formatters": formatters,
+            "aggregates": aggregates,
+            "unique_on": unique_on,
+            "page_size": page_size,
+            "paginate": paginate,
+            "sinks": sinks,
+            "truncate": truncate,
+        }
+        if unique and unique_on is None:
+            options["unique_on"] = titles or columns
         if not raw_table:
-            return self._MarkdownTable(self, titles=titles, sort_by=sort_by)
-        all_titles = remove_duplicates(
-            itertools.chain(*[dictionary.keys() for dictionary in raw_table])
-        )
-        with self._MarkdownTable(self, titles=all_titles, sort_by=sort_by) as table:
+            return self._MarkdownTable(
+                self, titles or columns, columns=columns, **options
+            )
+        if columns is None:
+            # Titles are discovered from every row, so iterators have to be kept.
+            if where is not None:
+                raw_table = list(filter(where, raw_table))
+                options["where"] = None
+            elif not isinstance(raw_table, Sequence):
+                raw_table = list(raw_table)
+            titles = remove_duplicates(
+                itertools.chain(*[dictionary.keys() for dictionary in raw_table])
+            )
+            if unique and unique_on is None:
+                options["unique_on"] = titles
+        with self._MarkdownTable(
+            self, titles or columns, columns=columns, **options
+        ) as table:
             table.bulk_add_rows(raw_table)
         return None
 
+    def table_from_csv(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        path_or_file: Union[str, Path, TextIO],
+        *,
+        columns: Optional[list] = None,
+        sort_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 10_000,
+        encoding: str = "UTF-8",
+        **fmtparams,
+    ):
+        """Adds a Markdown Table read from a CSV file.
+
+        The header row gives the table titles. Rows are read with `csv.reader` in
+        batches and added as they are read, without building a dictionary per row.
+        As with `csv.DictReader`, short rows are padded, blank rows are skipped and
+        an empty file adds nothing:
+
+        ```python
+        doc.table_from_csv("costs.csv", columns=["Account", "Cost"], limit=100)
+        ```
+
+        Args:
+            path_or_file (Union[str, Path, TextIO]): Path or fileobject to read,
+                fileobjects should be opened with `newline=""`.
+            columns (Optional[list], optional): Columns to keep, in order.
+                Defaults to None, all columns.
+            sort_by (Optional[str], optional): Table title to sort by.
+                Defaults to None.
+            limit (Optional[int], optional): Maximum rows to read.
+                Defaults to None, all rows.
+            batch_size (int, optional): Rows read at a time. Defaults to 10,000.
+            encoding (str, optional): Encoding to open paths with.
+                Defaults to "UTF-8".
+            **fmtparams: Dialect and formatting parameters, as per `csv.reader`.
+
+        Raises:
+            ValueError: If a column isn't in the header row.
+        """
+        import csv
+        from operator import itemgetter
+
+        with fileobj_open(path_or_file, encoding=encoding, newline="") as file:
+            reader = csv.reader(file, **fmtparams)
+            header_row = next(filter(None, reader), [])
+            if not header_row:
+                return
+            width = len(header_row)
+            if limit is not None:
+                reader = itertools.islice(reader, limit)
+            titles = header_row if columns is None else list(columns)
+            project = None
+            if columns is not None:
+                if not set(titles).issubset(header_row):
+                    raise ValueError("Column not found in headers.")
+                indexes = [header_row.index(column) for column in titles]
+                if len(indexes) == 1:
+                    # A single index would give a bare cell rather than a row.
+                    project = itemgetter(slice(indexes[0], indexes[0] + 1))
+                else:
+                    project = itemgetter(*indexes)
+            with self._MarkdownTable(self, titles=titles, sort_by=sort_by) as table:
+                batch = list(itertools.islice(reader, batch_size))
+                while batch:
+                    if set(map(len, batch)) != {width}:
+                        batch = [
+                            (row + [""] * (width - len(row)))[:width]
+                            for row in batch
+                            if row
+                        ]
+                    table.rows.extend(batch if project is None else map(project, batch))
+                    batch = list(itertools.islice(reader, batch_size))
+
+    def table_from_jsonl(  # pylint: disable=too-many-arguments
+        self,
+        path_or_file: Union[str, Path, TextIO],
+        columns: Optional[list] = None,
+        *,
+        sample: int = 1000,
+        default: str = "",
+        sort_by: Optional[str] = None,
+        encoding: str = "UTF-8",
+    ):
+        """Adds a Markdown Table read from a JSON Lines file, one object per line.
+
+        Nested objects are flattened into dotted column names, `{"cost": {"usd": 1}}`
+        has a `cost.usd` column. Without `columns`, the columns are discovered from
+        the first `sample` records, the rest are streamed into the table without
+        being held in memory as objects. Values other than strings are rendered as
+        JSON, missing and null values are filled with `default`:
+
+        ```python
+        doc.table_from_jsonl("events.jsonl", columns=["time", "event.type"])
+        ```
+
+        Args:
+            path_or_file (Union[str, Path, TextIO]): Path or fileobject to read.
+            columns (Optional[list], optional): Columns, as dotted paths.
+                Defaults to None, discovered from the sample.
+            sample (int, optional): Records to discover columns from.
+                Defaults to 1000.
+            default (str, optional): Value of missing columns. Defaults to "".
+            sort_by (Optional[str], optional): Table title to sort by.
+                Defaults to None.
+            encoding (str, optional): Encoding to open paths with.
+                Defaults to "UTF-8".
+        """
+        import json
+
+        with fileobj_open(path_or_file, encoding=encoding) as file:
+            records = (json.loads(line) for line in file if not line.isspace())
+            if columns is None:
+                sampled = list(itertools.islice(records, sample))
+                columns = remove_duplicates(
+                    itertools.chain.from_iterable(map(_flat_keys, sampled))
+                )
+                records = itertools.chain(sampled, records)
+            getters = [_path_getter(column, default) for column in columns]
+
+            def cell(value: Any) -> str:
+                if value is None:
+                    return default
+                return value if isinstance(value, str) else json.dumps(value)
+
+            def cells(record: dict) -> list[str]:
+                return [cell(get(record)) for get in getters]
+
+            with self._MarkdownTable(self, titles=columns, sort_by=sort_by) as table:
+                table.rows.extend(map(cells, records))
+
+    def table_from_cursor(
+        self,
+        cursor: Any,
+        *,
+        batch_size: int = 5000,
+        sort_by: Optional[str] = None,
+        null: str = "",
+    ):
+        """Adds a Markdown Table from the results of a DB-API cursor.
+
+        Titles are the column names in `cursor.description`, rows are fetched with
+        `fetchmany` and added in batches, without building a dictionary per row:
+
+        ```python
+        cursor = connection.execute("SELECT account, cost FROM costs")
+        doc.table_from_cursor(cursor)
+        ```
+
+        Args:
+            cursor (Any): Cursor with an executed query.
+            batch_size (int, optional): Rows fetched at a time. Defaults to 5000.
+            sort_by (Optional[str], optional): Table title to sort by.
+                Defaults to None.
+            null (str, optional): Value of NULL cells. Defaults to "".
+        """
+        titles = [column[0] for column in cursor.description]
+        with self._MarkdownTable(self, titles=titles, sort_by=sort_by) as table:
+            batch = cursor.fetchmany(batch_size)
+            while batch:
+                table.rows.extend(
+                    [null if cell is None else str(cell) for cell in row]
+                    for row in batch
+                )
+                batch = cursor.fetchmany(batch_size)
+
+    # pylint: disable-next=too-many-arguments,too-many-locals,too-many-branches
+    def pivot_table(
+        self,
+        rows: Iterable[dict],
+        index: Union[str, Callable[[dict], Any]],
+        columns: Union[str, Callable[[dict], Any]],
+        values: Optional[Union[str, Callable[[dict], Any]]] = None,
+        agg: Callable = sum,
+        *,
+        formatter: Callable[[Any], str] = str,
+        fill: str = "",
+        sort_by: Optional[str] = None,
+    ):
+        """Adds a pivot table, aggregating values by an index and a column key.
+
+        Rows are aggregated in a single pass into a cell per index and column value,
+        with columns in order of first appearance:
+
+        ```python
+        doc.pivot_table(costs, index="Account", columns="Month", values="Cost")
+        ```
+
+        `sum`, `min`, `max` and `len` are aggregated as rows arrive, other callables
+        are given the list of values of each cell.
+
+        Args:
+            rows (Iterable[dict]): Rows to pivot, can be a generator.
+            index (Union[str, Callable[[dict], Any]]): Column or callable giving the
+                table row of a row.
+            columns (Union[str, Callable[[dict], Any]]): Column or callable giving
+                the table column of a row.
+            values (Optional[Union[str, Callable[[dict], Any]]], optional): Column
+                or callable giving the value of a row. Defaults to None, only valid
+                with `len`.
+            agg (Callable, optional): Aggregate function. Defaults to sum.
+            formatter (Callable[[Any], str], optional): Cell formatter.
+                Defaults to str.
+            fill (str, optional): Value of empty cells. Defaults to "".
+            sort_by (Optional[str], optional): Table title to sort by.
+                Defaults to None.
+
+        Raises:
+            ValueError: No values to aggregate with a function other than `len`.
+        """
+        from operator import add
+
+        if values is None and agg is not len:
+            raise ValueError("Values are required unless aggregating with len.")
+        get_index = _row_getter(index)
+        get_column = _row_getter(columns)
+        if values is None:
+
+            def get_value(_row: dict) -> None:
+                return None
+
+        else:
+            get_value = _row_getter(values)
+        finish = None
+        if agg is sum:
+            # Seeded from 0 like sum, so strings raise rather than concatenate.
+            def start(value):
+                return 0 + value
+
+            combine = add
+        elif agg in (min, max):
+            start, combine = None, agg
+        elif agg is len:
+
+            def start(_value):
+                return 1
+
+            def combine(count, _value):
+                return count + 1
+
+        else:
+
+            def start(value):
+                return [value]
+
+            def combine(cell, value):
+                cell.append(value)
+                return cell
+
+            finish = agg
+
+        cells: dict[Any, dict[Any, Any]] = {}
+        column_keys: dict[Any, None] = {}
+        for row in rows:
+            key = get_index(row)
+            row_cells = cells.get(key)
+            if row_cells is None:
+                row_cells = cells[key] = {}
+            column = get_column(row)
+            value = get_value(row)
+            if column in row_cells:
+                row_cells[column] = combine(row_cells[column], value)
+            else:
+                column_keys[column] = None
+                row_cells[column] = value if start is None else start(value)
+
+        titles = [index if isinstance(index, str) else ""]
+        titles.extend(map(str, column_keys))
+        with self._MarkdownTable(self, titles=titles, sort_by=sort_by) as table:
+            for key, row_cells in cells.items():
+                row = [str(key)]
+                for column in column_keys:
+                    if column not in row_cells:
+                        row.append(fill)
+                    elif finish is None:
+                        row.append(formatter(row_cells[column]))
+                    else:
+                        row.append(formatter(finish(row_cells[column])))
+                table.rows.append(row)
+
+    def grouped_tables(
+        self,
+        rows: Iterable[dict],
+        by: Union[str, Callable[[dict], Any]],
+        *,
+        titles: Optional[list] = None,
+        sort_by: Optional[str] = None,
+        spill_after: Optional[int] = None,
+    ):
+        """Adds a table per group of rows, each under its own heading.
+
+        Rows are partitioned by the value of their `by` column (or callable) in a
+        single pass, then each group is rendered under a heading named after its
+        value, in order of first appearance:
+
+        ```python
+        doc.grouped_tables(accounts, by="OU", titles=["Name", "Email"])
+        ```
+
+        Args:
+            rows (Iterable[dict]): Rows to group, can be a generator.
+            by (Union[str, Callable[[dict], Any]]): Column or callable giving the
+                group of a row.
+            titles (Optional[list], optional): Table titles. Defaults to the keys of
+                the first row of each group.
+            sort_by (Optional[str], optional): Table title to sort by.
+                Defaults to None.
+            spill_after (Optional[int], optional): Rows a group holds in memory
+                before they're moved to a temporary file, shared by all groups,
+                can't be combined with `sort_by`. Defaults to None, never spill.
+
+        Raises:
+            ValueError: If both `sort_by` and `spill_after` are set.
+        """
+        if sort_by is not None and spill_after is not None:
+            raise ValueError("Sorted tables can't be spilled to disk.")
+        get_group = _row_getter(by)
+        tables: dict[Any, MarkdownDocument._MarkdownTable] = {}
+        spill_file = None
+        try:
+            for row in rows:
+                group = get_group(row)
+                table = tables.get(group)
+                if table is None:
+                    table = tables[group] = self._MarkdownTable(
+                        self, titles=titles or list(row), sort_by=sort_by
+                    )
+                # pylint: disable-next=protected-access
+                table.rows.append(table._convert(row))
+                if spill_after is not None and len(table.rows) >= spill_after:
+                    if spill_file is None:
+                        import tempfile
+
+                        # Closed in the finally block, even if the rows raise.
+                        # pylint: disable-next=consider-using-with
+                        spill_file = tempfile.TemporaryFile()
+                    table.spill(spill_file)
+            for group in list(tables):
+                with self.heading(str(group)):
+                    # pylint: disable-next=protected-access
+                    self.paragraph(tables.pop(group)._render())
+        finally:
+            if spill_file is not None:
+                spill_file.close()
+
     def list(
         self, item: str, ordered: bool = False, prefix: Optional[str] = None
     ) -> _MarkdownList:
@@ -309,6 +1142,159 @@ class MarkdownDocument:
             item=item, ordered=ordered, document=self, prefix=prefix
         )
 
+    def list_tree(  # pylint: disable=too-many-locals
+        self,
+        tree: Union[Mapping, Iterable],
+        ordered: bool = False,
+        *,
+        key: Optional[Union[str, Callable[[Any], str]]] = None,
+        children: Optional[Union[str, Callable[[Any], Iterable]]] = None,
+        prefix: Optional[str] = None,
+    ):
+        """Adds a whole tree of nested list items to the document.
+
+        Produces the same output as nesting `list` context managers, but walks the
+        tree iteratively, so there is no recursion limit on its depth, and appends
+        the lines in bulk.
+
+        Without `key`, mappings are treated as item to children pairs, and the items
+        of other iterables are leaf items (or item to children pairs if they are
+        mappings themselves):
+
+        ```python
+        doc.list_tree({"Parent": ["Child", {"Other Child": ["Grandchild"]}]})
+        ```
+
+        With `key`, every node is an object (or mapping) with its item text found by
+        `key` and its child nodes found by `children`:
+
+        ```python
+        doc.list_tree([package], key="name", children="dependencies")
+        ```
+
+        Args:
+            tree (Union[Mapping, Iterable]): Root nodes.
+            ordered (bool, optional): If the list is ordered or not. Defaults to False.
+            key (Optional[Union[str, Callable[[Any], str]]], optional): Attribute
+                name, mapping key or callable giving a node's item text.
+                Defaults to None.
+            children (Optional[Union[str, Callable[[Any], Iterable]]], optional):
+                Attribute name, mapping key or callable giving a node's children,
+                missing children are leaf nodes. Only used with `key`.
+                Defaults to None.
+            prefix (Optional[str], optional): Custom prefix on list items.
+                Defaults to None.
+        """
+        if key is None:
+            nodes = _tree_nodes
+        else:
+            get_key = _getter(key)
+            get_children = _getter(children or (lambda node: None), optional=True)
+
+            def nodes(values):
+                return ((get_key(node), get_children(node)) for node in values)
+
+        indents = []
+        lines = []
+        stack = [nodes(tree)]
+        while stack:
+            depth = len(stack) - 1
+            if depth == len(indents):
+                # Same as _indent with `depth` lists entered.
+                in_list = self._in_list or depth > 0
+                indents.append(" " * ((self._indent_level + depth + in_list) * 4))
+            for item, item_children in stack[-1]:
+                lines.append(
+                    indents[depth]
+                    + list_item(str(item), ordered=ordered, prefix=prefix)
+                )
+                if isinstance(item_children, str):
+                    item_children = (item_children,)
+                if item_children:
+                    stack.append(nodes(item_children))
+                    break
+            else:
+                stack.pop()
+        self._buffer.extend(lines)
+
+    def hierarchy(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        tree: Any,
+        *,
+        heading_key: Union[str, Callable[[Any], str]] = "name",
+        rows_key: Union[str, Callable[[Any], Iterable[dict]]] = "rows",
+        children_key: Union[str, Callable[[Any], Iterable]] = "children",
+        titles: Optional[list] = None,
+        sort_by: Optional[str] = None,
+    ):
+        """Adds a hierarchy of nested headings, each with an optional table.
+
+        Every node is an object (or mapping) with a heading, rows for its table and
+        child nodes, each found by their key, attribute name or callable. Missing
+        rows or children are skipped. Produces the same output as nesting `heading`
+        context managers with a `table` in each, but walks the tree iteratively, so
+        there is no recursion limit on its depth:
+
+        ```python
+        doc.hierarchy(
+            {
+                "name": "Root",
+                "rows": [{"Account": "Management"}],
+                "children": [{"name": "Workloads", "rows": accounts("workloads")}],
+            }
+        )
+        ```
+
+        Children and rows can be generators, nodes are visited in order as they
+        are produced. With `titles`, rows are streamed straight into each table,
+        otherwise each node's rows are collected to discover the table titles.
+
+        Args:
+            tree (Any): Root node, or an iterable of root nodes.
+            heading_key (Union[str, Callable[[Any], str]], optional): Attribute
+                name, mapping key or callable giving a node's heading.
+                Defaults to "name".
+            rows_key (Union[str, Callable[[Any], Iterable[dict]]], optional):
+                Attribute name, mapping key or callable giving a node's table rows.
+                Defaults to "rows".
+            children_key (Union[str, Callable[[Any], Iterable]], optional):
+                Attribute name, mapping key or callable giving a node's children.
+                Defaults to "children".
+            titles (Optional[list], optional): Table titles, shared by all tables.
+                Defaults to None.
+            sort_by (Optional[str], optional): Table title to sort by.
+                Defaults to None.
+        """
+        get_heading = _getter(heading_key)
+        get_rows = _getter(rows_key, optional=True)
+        get_children = _getter(children_key, optional=True)
+        if isinstance(tree, Mapping) or not hasattr(tree, "__iter__"):
+            tree = (tree,)
+
+        base_level = self._heading_level
+        stack = [iter(tree)]
+        while stack:
+            for node in stack[-1]:
+                self._buffer.append(
+                    _HeadingLine(get_heading(node), base_level + len(stack) - 1)
+                )
+                self.linebreak()
+                rows = iter(get_rows(node) or ())
+                first = next(rows, None)
+                if first is not None:
+                    rows = itertools.chain((first,), rows)
+                    if titles is None:
+                        self.table(list(rows), sort_by=sort_by)
+                    else:
+                        with self.table(titles=titles, sort_by=sort_by) as table:
+                            table.bulk_add_rows(rows)
+                children = get_children(node)
+                if children:
+                    stack.append(iter(children))
+                    break
+            else:
+                stack.pop()
+
     @contextmanager
     def collapsed(self, summary: str):
         """Adds collapsable section to the document.
@@ -371,6 +1357,268 @@ class MarkdownDocument:
         """
         self._buffer.append(text)
 
+    def include(self, document: MarkdownDocument):
+        """Embeds another document by reference.
+
+        The included document is only rendered when this document is rendered, so it
+        can still be modified after being included. Its lines are indented to the
+        current indent level and its headings are shifted to sit under the current
+        heading.
+
+        ```python
+        section = MarkdownDocument()
+        with section.heading("Section"):
+            section.paragraph("Section content.")
+
+        with doc.heading("Report"):
+            doc.include(section)
+        ```
+
+        Args:
+            document (MarkdownDocument): Document to embed.
+
+        Raises:
+            ValueError: Document includes itself. Cycles through other documents are
+                found when rendering.
+        """
+        if document is self:
+            raise ValueError("Document can not include itself.")
+        self._buffer.append(
+            self._MarkdownInclude(document, self._indent, self._heading_level - 1)
+        )
+        self._has_includes = True
+
+    def section(
+        self,
+        heading: str,
+        builder: Callable[[MarkdownDocument], None],
+        *,
+        cache: Optional[SectionCache] = None,
+        key: Optional[str] = None,
+    ):
+        """Adds a heading section populated by a builder.
+
+        The builder is called with a new, empty document which is then included under
+        the heading. With a cache, the section is only rebuilt when its key changes.
+
+        ```python
+        cache = SectionCache(".markdown-cache")
+        doc.section("Accounts", functools.partial(build_accounts, org), cache=cache)
+        ```
+
+        Args:
+            heading (str): Section heading.
+            builder (Callable[[MarkdownDocument], None]): Section builder.
+            cache (Optional[SectionCache], optional): Cache of built sections.
+                Defaults to None.
+            key (Optional[str], optional): Cache key. Defaults to a hash of the builder
+                and its `functools.partial` arguments.
+        """
+        if cache is None:
+            document = _build_section(builder, self._newline_character)
+        else:
+            document = cache.build(builder, key=key)
+        with self.heading(heading):
+            self.include(document)
+
+    def sections(  # pylint: disable=too-many-locals
+        self,
+        sections: Iterable[tuple[str, Callable[[MarkdownDocument], None]]],
+        *,
+        executor: Optional[Executor] = None,
+        chunksize: int = 1,
+        cache: Optional[SectionCache] = None,
+    ):
+        """Builds independent heading sections concurrently.
+
+        Each builder is called with a new, empty document to populate. The finished
+        documents are included under their headings in the order they were declared,
+        regardless of the order they finish in.
+
+        ```python
+        def build_account(account, section):
+            section.table(account["resources"])
+
+        doc.sections(
+            (account["name"], functools.partial(build_account, account))
+            for account in accounts
+        )
+        ```
+
+        By default the builders run in a `ProcessPoolExecutor`, so they have to be
+        picklable (module level functions or `functools.partial` of them). Pass a
+        `ThreadPoolExecutor` for I/O bound builders or builders which can't be pickled.
+
+        Args:
+            sections (Iterable[tuple[str, Callable[[MarkdownDocument], None]]]): Pairs
+                of section heading and builder.
+            executor (Optional[Executor], optional): Executor to run the builders in.
+                Defaults to a `ProcessPoolExecutor` for the duration of the call.
+            chunksize (int, optional): Builders sent to each worker process at a time.
+                Defaults to 1.
+            cache (Optional[SectionCache], optional): Cache of built sections, keyed by
+                a hash of each builder. Only missing sections are submitted to the
+                executor. Defaults to None.
+        """
+        headings = []
+        builders = []
+        for heading, builder in sections:
+            headings.append(heading)
+            builders.append(builder)
+        documents: list[Optional[MarkdownDocument]] = [None] * len(builders)
+        keys: list[Optional[str]] = [None] * len(builders)
+        if cache is not None:
+            for idx, builder in enumerate(builders):
+                keys[idx] = cache.key(builder)
+                documents[idx] = cache.get(keys[idx])
+        pending = [idx for idx, document in enumerate(documents) if document is None]
+        if pending:
+            pending_builders = [builders[idx] for idx in pending]
+            newline_characters = itertools.repeat(
+                self._newline_character, len(pending)
+            )
+            if executor is None:
+                from concurrent.futures import ProcessPoolExecutor
+
+                with ProcessPoolExecutor() as pool:
+                    built = list(
+                        pool.map(
+                            _build_section,
+                            pending_builders,
+                            newline_characters,
+                            chunksize=chunksize,
+                        )
+                    )
+            else:
+                built = list(
+                    executor.map(
+                        _build_section,
+                        pending_builders,
+                        newline_characters,
+                        chunksize=chunksize,
+                    )
+                )
+            for idx, document in zip(pending, built):
+                documents[idx] = document
+                if cache is not None:
+                    cache.set(keys[idx], document)
+        for heading, document in zip(headings, documents):
+            with self.heading(heading):
+                self.include(document)
+
+    def asection(
+        self,
+        heading: str,
+        builder: Callable[[MarkdownDocument], Awaitable[None]],
+        *,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Awaitable[None]:
+        """Adds a heading section populated by a coroutine.
+
+        The section's place in the document is reserved when this method is called,
+        so sections stay in call order however long their builders take.
+
+        ```python
+        async def build_ou(section):
+            accounts = await fetch_accounts("OU")
+            section.table(accounts)
+
+        await asyncio.gather(
+            doc.asection("First OU", build_ou),
+            doc.asection("Second OU", build_other_ou),
+        )
+        ```
+
+        Args:
+            heading (str): Section heading.
+            builder (Callable[[MarkdownDocument], Awaitable[None]]): Coroutine function
+                called with an empty document to populate.
+            semaphore (Optional[asyncio.Semaphore], optional): Semaphore to hold while
+                the builder runs. Defaults to None.
+
+        Returns:
+            Awaitable[None]: Awaitable which runs the builder.
+        """
+        document = MarkdownDocument(self._newline_character)
+        with self.heading(heading):
+            self.include(document)
+        return _build_async_section(builder, document, semaphore)
+
+    async def asections(
+        self,
+        sections: Iterable[tuple[str, Callable[[MarkdownDocument], Awaitable[None]]]],
+        *,
+        limit: Optional[int] = None,
+    ):
+        """Builds heading sections concurrently with coroutines.
+
+        ```python
+        await doc.asections(
+            ((ou["Name"], functools.partial(build_ou, ou)) for ou in org_units),
+            limit=20,
+        )
+        ```
+
+        Args:
+            sections (Iterable[tuple[str, Callable[[MarkdownDocument], Awaitable[None]]]]):
+                Pairs of section heading and coroutine function builder.
+            limit (Optional[int], optional): Maximum builders running at once.
+                Defaults to None, for no limit.
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(limit) if limit else None
+        await asyncio.gather(
+            *[
+                self.asection(heading, builder, semaphore=semaphore)
+                for heading, builder in sections
+            ]
+        )
+
+    def _lines(self, indent: str = "", heading_offset: int = 0) -> Iterator[str]:
+        """Yields document lines, expanding included documents in place.
+
+        Args:
+            indent (str, optional): Prefix for every non empty line. Defaults to "".
+            heading_offset (int, optional): Levels to shift headings by. Defaults to 0.
+
+        Yields:
+            str: Document line.
+
+        Raises:
+            ValueError: Document includes itself, directly or through other documents.
+        """
+        stack = [(iter(self._buffer), indent, heading_offset, self)]
+        # Documents being expanded, an include of one of them would never end.
+        expanding = {id(self)}
+        while stack:
+            lines, indent, heading_offset, _ = stack[-1]
+            for line in lines:
+                if isinstance(line, MarkdownDocument._MarkdownInclude):
+                    if id(line.document) in expanding:
+                        raise ValueError("Document can not include itself.")
+                    expanding.add(id(line.document))
+                    stack.append(
+                        (
+                            # pylint: disable-next=protected-access
+                            iter(line.document._buffer),
+                            indent + line.indent,
+                            heading_offset + line.heading_offset,
+                            line.document,
+                        )
+                    )
+                    break
+                if isinstance(line, _HeadingLine):
+                    if heading_offset:
+                        line = _HeadingLine(line.heading, line.level + heading_offset)
+                    yield line
+                elif indent and line:
+                    yield indent + line
+                else:
+                    yield line
+            else:
+                expanding.discard(id(stack.pop()[3]))
+
     def text(self, text: str = ""):
         """Add text to document, taking into account indent level.
 
@@ -436,16 +1684,219 @@ class MarkdownDocument:
         Returns:
             str: Rendered document.
         """
-        document = "\n".join(self._buffer)
+        if self._has_includes:
+            document = "\n".join(self._lines())
+        else:
+            document = "\n".join(self._buffer)
         if trailing_whitespace:
             return document + "\n"
         return document
 
-    def write(self, file: Union[str, StringIO]):
+    def write(  # pylint: disable=too-many-arguments
+        self,
+        file: Union[str, Path, StringIO],
+        *,
+        trailing_whitespace: bool = False,
+        encoding: str = "UTF-8",
+        newline: Optional[str] = None,
+        atomic: bool = False,
+        chunk_size: int = 1024,
+    ):
         """Helper method to write the document contents to a file or filelike object.
 
+        The document is written a chunk of lines at a time rather than rendered to a
+        single string first, so writing a large document doesn't double its memory use.
+
         Args:
-            file (Union[str, StringIO]): Path to file, or filelike object already opened.
+            file (Union[str, Path, StringIO]): Path to file, or filelike object
+                already opened.
+            trailing_whitespace (bool, optional): Add linebreak to the end of the
+                document. Defaults to False.
+            encoding (str, optional): Encoding used when opening a path.
+                Defaults to "UTF-8".
+            newline (Optional[str], optional): Newline translation used when opening a
+                path, as per `open`. Defaults to None.
+            atomic (bool, optional): Write to a temporary file next to the path and
+                rename it over the path once complete, keeping the mode of an existing
+                file. Defaults to False.
+            chunk_size (int, optional): Lines passed to `writelines` at a time.
+                Defaults to 1024.
+
+        Raises:
+            ValueError: Atomic write requested for a filelike object.
         """
-        with fileobj_open(file) as file_object:
-            file_object.write(self.render())
+        if not atomic:
+            with fileobj_open(
+                file, "w", encoding=encoding, newline=newline
+            ) as file_object:
+                self._write_lines(file_object, trailing_whitespace, chunk_size)
+            return
+        if not isinstance(file, (str, os.PathLike)):
+            raise ValueError("Atomic writes need a path to write to.")
+        path = os.fspath(file)
+        directory, name = os.path.split(os.path.abspath(path))
+        while True:
+            temporary_path = os.path.join(
+                directory, f".{name}.{os.urandom(4).hex()}.tmp"
+            )
+            try:
+                # Created with the mode open() uses, so the umask applies as usual.
+                descriptor = os.open(
+                    temporary_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666
+                )
+            except FileExistsError:
+                continue
+            break
+        try:
+            with open(
+                descriptor, "w", encoding=encoding, newline=newline
+            ) as file_object:
+                self._write_lines(file_object, trailing_whitespace, chunk_size)
+            if os.path.exists(path):
+                os.chmod(temporary_path, os.stat(path).st_mode & 0o7777)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def _write_lines(self, file_object, trailing_whitespace: bool, chunk_size: int):
+        lines = self._lines() if self._has_includes else iter(self._buffer)
+        first = next(lines, None)
+        if first is not None:
+            file_object.write(first)
+            chunk = list(itertools.islice(lines, chunk_size))
+            while chunk:
+                file_object.writelines("\n" + line for line in chunk)
+                chunk = list(itertools.islice(lines, chunk_size))
+        if trailing_whitespace:
+            file_object.write("\n")
+
+
+def _getter(
+    spec: Union[str, Callable[[Any], Any]], optional: bool = False
+) -> Callable[[Any], Any]:
+    """Turns an attribute name or mapping key into a getter, callables pass through.
+
+    Optional getters return None for missing keys and attributes.
+    """
+    if callable(spec):
+        return spec
+
+    def get(value):
+        if isinstance(value, Mapping):
+            return value.get(spec) if optional else value[spec]
+        return getattr(value, spec, None) if optional else getattr(value, spec)
+
+    return get
+
+
+def _row_getter(spec: Union[str, Callable[[dict], Any]]) -> Callable[[dict], Any]:
+    """Turns a column name into a getter for dict rows, callables pass through."""
+    if callable(spec):
+        return spec
+    from operator import itemgetter
+
+    return itemgetter(spec)
+
+
+def _tree_nodes(values: Union[Mapping, Iterable]) -> Iterator[tuple[Any, Any]]:
+    """Yields (item, children) pairs of a nested mapping and iterable tree level."""
+    if isinstance(values, Mapping):
+        yield from values.items()
+        return
+    for value in values:
+        if isinstance(value, Mapping):
+            yield from value.items()
+        else:
+            yield value, None
+
+
+def _row_converter(keys: list, formatters: list) -> Callable[[dict], list]:
+    """Returns a function formatting the cells of a row, in order of their keys.
+
+    None formatters leave values as they are.
+    """
+    from operator import itemgetter
+
+    if len(keys) == 1:
+        key = keys[0]
+
+        def get(row: dict) -> tuple:
+            return (row[key],)
+
+    elif keys:
+        get = itemgetter(*keys)
+    else:
+
+        def get(_row: dict) -> tuple:
+            return ()
+
+    if all(formatter is None for formatter in formatters):
+
+        def convert(row: dict) -> list:
+            return list(get(row))
+
+    elif all(formatter is str for formatter in formatters):
+
+        def convert(row: dict) -> list:
+            return list(map(str, get(row)))
+
+    else:
+
+        def convert(row: dict) -> list:
+            return [
+                value if format_cell is None else format_cell(value)
+                for format_cell, value in zip(formatters, get(row))
+            ]
+
+    return convert
+
+
+def _flat_keys(record: dict, prefix: str = "") -> Iterator[str]:
+    """Yields the dotted paths of the leaf values of a nested object."""
+    for key, value in record.items():
+        if isinstance(value, dict) and value:
+            yield from _flat_keys(value, f"{prefix}{key}.")
+        else:
+            yield prefix + key
+
+
+def _path_getter(path: str, default: Any) -> Callable[[dict], Any]:
+    """Turns a dotted path into a getter for nested objects, defaulting if missing."""
+    keys = path.split(".")
+    if len(keys) == 1:
+        return lambda record: record.get(path, default)
+
+    def get(record):
+        if path in record:
+            return record[path]
+        value = record
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                return default
+            value = value[key]
+        return value
+
+    return get
+
+
+def _build_section(
+    builder: Callable[[MarkdownDocument], None], newline_character: str
+) -> MarkdownDocument:
+    """Runs a section builder against a new document, in a worker if need be."""
+    document = MarkdownDocument(newline_character)
+    builder(document)
+    return document
+
+
+async def _build_async_section(
+    builder: Callable[[MarkdownDocument], Awaitable[None]],
+    document: MarkdownDocument,
+    semaphore: Optional[asyncio.Semaphore],
+):
+    """Runs an async section builder, holding the semaphore if there is one."""
+    if semaphore is None:
+        await builder(document)
+        return
+    async with semaphore:
+        await builder(document)
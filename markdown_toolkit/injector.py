@@ -4,10 +4,16 @@ from __future__ import annotations
 import re
 from collections import defaultdict
 from types import SimpleNamespace
-from typing import Optional, TextIO
 
+from markdown_toolkit.instrumentation import instrument
 from markdown_toolkit.utils import sanitise_attribute
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional, TextIO
+
+    from markdown_toolkit.instrumentation import Instrumentation
+
 
 class Anchors(SimpleNamespace):  # pylint: disable=too-few-public-methods
     """SimpleNamespace extended to raise ValueError on missing attributes."""
@@ -27,10 +33,26 @@ class MarkdownInjector:
 
     matcher = re.compile(r".*<!---\s?markdown-toolkit:(.*)\s?--->.*")
 
-    def __init__(self, file_obj: TextIO):
+    def __init__(
+        self, file_obj: TextIO, instrumentation: Optional[Instrumentation] = None
+    ):
+        self._instrumentation: Optional[Instrumentation] = None
+        if instrumentation is not None:
+            instrument(self, instrumentation, ("_find_anchors", "render"))
         self.file_buffer = file_obj.read().splitlines()
         self._anchors = self._find_anchors()
 
+    def stats(self) -> dict:
+        """Instrumentation statistics, if the injector was created with instrumentation.
+
+        Returns:
+            dict: Calls and cumulative seconds per instrumented method, including
+                the anchors of this document.
+        """
+        if self._instrumentation is None:
+            return {}
+        return self._instrumentation.stats()
+
     @staticmethod
     def _find_overlaps(ranges: dict):
         for anchor, range_extents in ranges.items():
@@ -100,12 +122,16 @@ class MarkdownInjector:
 class MarkdownAnchor:
     """This class represents the document object between two anchor points."""
 
+    __slots__ = ("doc", "anchor", "matcher", "_instrumentation")
+
     def __init__(self, document: MarkdownInjector, anchor: str):
         self.doc = document
         self.anchor = anchor
         self.matcher = re.compile(
             rf"(.*)<!---\s?markdown-toolkit:{self.anchor}\s?--->.*"
         )
+        if document._instrumentation is not None:
+            instrument(self, document._instrumentation, ("_index_finder", "value"))
 
     def __repr__(self) -> str:
         _start, _end, _indent, _value = self._index_finder()
@@ -0,0 +1,116 @@
+"""Markdown Toolkit instrumentation.
+
+Instrumentation is opt-in per object. Instrumented objects are switched to a
+subclass with timed versions of their hot methods, so objects without
+instrumentation run the plain methods with no extra overhead.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from functools import wraps
+from time import perf_counter
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Optional
+
+__all__ = ["Instrumentation"]
+
+
+class Instrumentation:
+    """Call counters and cumulative timings of instrumented methods.
+
+    Pass an instance to `MarkdownDocument` or `MarkdownInjector` to instrument
+    them, the same instance can be shared between several objects.
+
+    ```python
+    instrumentation = Instrumentation(callback=lambda name, seconds: print(name))
+    doc = MarkdownDocument(instrumentation=instrumentation)
+    doc.paragraph("Example")
+    doc.stats()
+    ```
+
+    Timings include time spent in nested instrumented calls, for example
+    `MarkdownDocument.paragraph` includes its calls to `MarkdownDocument.text`.
+
+    Args:
+        callback (Optional[Callable[[str, float], None]], optional): Called with the
+            name and duration in seconds of every instrumented call. Defaults to None.
+    """
+
+    def __init__(self, callback: Optional[Callable[[str, float], None]] = None):
+        self.callback = callback
+        self.calls: dict[str, int] = defaultdict(int)
+        self.seconds: dict[str, float] = defaultdict(float)
+
+    def record(self, name: str, seconds: float):
+        """Records a call.
+
+        Args:
+            name (str): Instrumented method name.
+            seconds (float): Call duration.
+        """
+        self.calls[name] += 1
+        self.seconds[name] += seconds
+        if self.callback is not None:
+            self.callback(name, seconds)
+
+    def stats(self) -> dict:
+        """Calls and cumulative seconds per instrumented method.
+
+        Returns:
+            dict: Mapping of method name to its `calls` and `seconds`.
+        """
+        return {
+            name: {"calls": self.calls[name], "seconds": self.seconds[name]}
+            for name in sorted(self.calls)
+        }
+
+
+_INSTRUMENTED_CLASSES: dict[tuple[type, tuple[str, ...]], type] = {}
+
+
+def _timed(function: Callable, name: str) -> Callable:
+    @wraps(function)
+    def timed(self, *args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            # pylint: disable-next=protected-access
+            self._instrumentation.record(name, perf_counter() - start)
+
+    return timed
+
+
+def _instrumented_class(cls: type, attributes: tuple[str, ...]) -> type:
+    key = (cls, attributes)
+    if key not in _INSTRUMENTED_CLASSES:
+        prefix = cls.__name__.lstrip("_")
+        namespace = {"__slots__": ()}
+        for attribute in attributes:
+            value = getattr(cls, attribute)
+            name = f"{prefix}.{attribute}"
+            if isinstance(value, property):
+                namespace[attribute] = property(
+                    value.fget and _timed(value.fget, name),
+                    value.fset and _timed(value.fset, f"{name}.setter"),
+                    value.fdel and _timed(value.fdel, f"{name}.deleter"),
+                    value.__doc__,
+                )
+            else:
+                namespace[attribute] = _timed(value, name)
+        _INSTRUMENTED_CLASSES[key] = type(cls.__name__, (cls,), namespace)
+    return _INSTRUMENTED_CLASSES[key]
+
+
+def instrument(obj: object, instrumentation: Instrumentation, attributes: tuple):
+    """Switches an object to timed versions of the listed methods and properties.
+
+    Args:
+        obj (object): Object to instrument.
+        instrumentation (Instrumentation): Collector to record calls to.
+        attributes (tuple): Method and property names to time.
+    """
+    obj._instrumentation = instrumentation  # pylint: disable=protected-access
+    obj.__class__ = _instrumented_class(type(obj), attributes)
@@ -0,0 +1,211 @@
+"""Markdown Toolkit profiling.
+
+Runs `cProfile` and `tracemalloc` around document generation and writes the
+results as a markdown report. Either wrap the code to profile:
+
+```python
+with profile("profile.md"):
+    build_documentation()
+```
+
+or profile a whole process by setting the `MARKDOWN_TOOLKIT_PROFILE=1`
+environment variable, which writes the report to the path in
+`MARKDOWN_TOOLKIT_PROFILE_OUTPUT` (default `markdown-toolkit-profile.md`) on exit.
+"""
+from __future__ import annotations
+
+import atexit
+import cProfile
+import os
+import pstats
+import tracemalloc
+import weakref
+from contextlib import contextmanager
+from io import StringIO
+from pathlib import Path
+from time import perf_counter
+from typing import Generator, Optional, Union
+
+from markdown_toolkit import document as document_module
+from markdown_toolkit.document import MarkdownDocument
+from markdown_toolkit.utils import code
+
+__all__ = ["Profile", "profile"]
+
+DEFAULT_OUTPUT = "markdown-toolkit-profile.md"
+
+
+class Profile:  # pylint: disable=too-many-instance-attributes
+    """Profiling session collecting CPU and memory statistics.
+
+    Args:
+        top (int, optional): Rows in each report table. Defaults to 20.
+    """
+
+    def __init__(self, top: int = 20):
+        self.top = top
+        self.profiler = cProfile.Profile()
+        self.elapsed: float = 0.0
+        self.peak_memory: int = 0
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.lines: int = 0
+        self._documents: list[weakref.finalize] = []
+        self._started: float = 0.0
+        self._stop_tracing = False
+
+    def start(self):
+        """Starts collecting statistics."""
+        self._stop_tracing = not tracemalloc.is_tracing()
+        if self._stop_tracing:
+            tracemalloc.start()
+        # pylint: disable-next=protected-access
+        document_module._DOCUMENT_HOOKS.append(self._track)
+        self._started = perf_counter()
+        self.profiler.enable()
+
+    def stop(self):
+        """Stops collecting statistics."""
+        self.profiler.disable()
+        self.elapsed = perf_counter() - self._started
+        # pylint: disable-next=protected-access
+        document_module._DOCUMENT_HOOKS.remove(self._track)
+        for finalizer in self._documents:
+            # Counts the documents still alive, the rest were counted when collected.
+            finalizer()
+        self._documents = []
+        _, self.peak_memory = tracemalloc.get_traced_memory()
+        self.snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ]
+        )
+        if self._stop_tracing:
+            tracemalloc.stop()
+
+    def _track(self, document: MarkdownDocument):
+        """Counts the lines of a document once it's collected, or profiling stops."""
+        # The finalizer holds the attributes rather than the document, so it can be
+        # collected, and sees buffers replaced after the document was created.
+        self._documents.append(
+            weakref.finalize(document, self._count, document.__dict__)
+        )
+
+    def _count(self, attributes: dict):
+        # Included documents are the only entries that aren't lines.
+        self.lines += sum(isinstance(line, str) for line in attributes["_buffer"])
+
+    def lines_produced(self) -> int:
+        """Lines in the buffers of documents created while profiling.
+
+        Lines of included documents are counted in those documents, if they were
+        created while profiling.
+
+        Returns:
+            int: Line count.
+        """
+        return self.lines
+
+    def _stats(self) -> dict:
+        """Raw `pstats` statistics, keyed by (filename, line number, function)."""
+        return pstats.Stats(self.profiler).stats  # pylint: disable=no-member
+
+    def report(self) -> MarkdownDocument:
+        """Renders the collected statistics as a markdown document.
+
+        Returns:
+            MarkdownDocument: Profile report.
+        """
+        lines = self.lines_produced()
+        lines_per_second = f"{lines / self.elapsed:,.0f}" if self.elapsed else "-"
+        functions = sorted(
+            self._stats().items(), key=lambda item: item[1][3], reverse=True
+        )[: self.top]
+        doc = MarkdownDocument()
+        with doc.heading("Markdown Toolkit Profile"):
+            doc.table(
+                [
+                    {"Metric": "Wall time", "Value": f"{self.elapsed:.3f} s"},
+                    {
+                        "Metric": "Peak memory",
+                        "Value": f"{self.peak_memory / 1024 / 1024:,.2f} MiB",
+                    },
+                    {"Metric": "Lines produced", "Value": f"{lines:,}"},
+                    {"Metric": "Lines per second", "Value": lines_per_second},
+                ]
+            )
+            with doc.heading("Top Functions by Cumulative Time"):
+                with doc.table(
+                    titles=["Function", "Calls", "Own Time (s)", "Cumulative (s)"]
+                ) as table:
+                    for function, (_, calls, own, cumulative, _) in functions:
+                        table.add_row(
+                            function=code(_function_name(*function)),
+                            calls=f"{calls:,}",
+                            own_time__s_=f"{own:.4f}",
+                            cumulative__s_=f"{cumulative:.4f}",
+                        )
+            with doc.heading("Top Allocation Sites"):
+                with doc.table(titles=["Location", "Size (KiB)", "Blocks"]) as table:
+                    for stat in self.snapshot.statistics("lineno")[: self.top]:
+                        frame = stat.traceback[0]
+                        location = f"{Path(frame.filename).name}:{frame.lineno}"
+                        table.add_row(
+                            location=code(location),
+                            size__kib_=f"{stat.size / 1024:,.1f}",
+                            blocks=f"{stat.count:,}",
+                        )
+        return doc
+
+
+def _function_name(filename: str, lineno: int, name: str) -> str:
+    if filename == "~":
+        return name
+    return f"{Path(filename).name}:{lineno}({name})"
+
+
+@contextmanager
+def profile(
+    output: Optional[Union[str, Path, StringIO]] = DEFAULT_OUTPUT, top: int = 20
+) -> Generator[Profile, None, None]:
+    """Profiles the code inside the context and writes a markdown report.
+
+    ```python
+    with profile("profile.md") as session:
+        build_documentation()
+    print(session.report().render())
+    ```
+
+    Args:
+        output (Optional[Union[str, Path, StringIO]], optional): Path or fileobject
+            to write the report to, None to skip writing it.
+            Defaults to "markdown-toolkit-profile.md".
+        top (int, optional): Rows in each report table. Defaults to 20.
+
+    Yields:
+        Profile: Profiling session.
+    """
+    session = Profile(top=top)
+    session.start()
+    try:
+        yield session
+    finally:
+        session.stop()
+        if output is not None:
+            session.report().write(output, trailing_whitespace=True)
+
+
+def profile_process():
+    """Profiles the rest of the process, writing the report when it exits."""
+    session = Profile()
+    session.start()
+
+    def write_report():
+        session.stop()
+        session.report().write(
+            os.environ.get("MARKDOWN_TOOLKIT_PROFILE_OUTPUT", DEFAULT_OUTPUT),
+            trailing_whitespace=True,
+        )
+
+    atexit.register(write_report)
@@ -0,0 +1,140 @@
+"""Markdown Toolkit table sinks.
+
+Sinks receive every row added to a table, in the same pass that renders it, to
+publish the raw data next to the markdown:
+
+```python
+with CSVSink("costs.csv") as sink:
+    doc.table(rows, sinks=[sink], truncate=100)
+```
+
+Truncated tables link to the `url` of their sinks, which defaults to a relative
+path as given, so pass the `url` of the data relative to the document otherwise.
+
+Any object with `start(titles)` and `write(values)` methods can be used as a sink.
+"""
+from __future__ import annotations
+
+import abc
+import csv
+import json
+import os
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Optional, TextIO, Union
+
+__all__ = ["CSVSink", "JSONLSink"]
+
+
+class _FileSink(abc.ABC):
+    """Sink writing to a path, opened when the table starts, or a fileobject.
+
+    Args:
+        path_or_file (Union[str, Path, TextIO]): Path or fileobject to write to.
+        encoding (str, optional): Encoding to open paths with. Defaults to "UTF-8".
+        url (Optional[str], optional): Link to the data from the document.
+            Defaults to the path if it's relative, otherwise no link.
+    """
+
+    def __init__(
+        self,
+        path_or_file: Union[str, Path, TextIO],
+        encoding: str = "UTF-8",
+        url: Optional[str] = None,
+    ):
+        self.path: Optional[str] = None
+        self.file: Optional[TextIO] = None
+        self.encoding = encoding
+        self.url = url
+        if isinstance(path_or_file, (str, os.PathLike)):
+            self.path = os.fspath(path_or_file)
+            if url is None and not os.path.isabs(self.path):
+                self.url = self.path.replace(os.sep, "/")
+        else:
+            self.file = path_or_file
+        self.titles: list = []
+
+    def _open(self):
+        if self.file is None:
+            # Closed by close(), or when used as a context manager.
+            self.file = open(  # pylint: disable=consider-using-with
+                self.path, "w", encoding=self.encoding, newline=""
+            )
+
+    def start(self, titles: list):
+        """Called with the table titles, before any rows are written.
+
+        Args:
+            titles (list): Table titles.
+        """
+        self._open()
+        self.titles = titles
+
+    @abc.abstractmethod
+    def write(self, values: list):
+        """Writes a row.
+
+        Args:
+            values (list): Row values, in the order of the titles.
+        """
+
+    def close(self):
+        """Closes the file, if it was opened from a path."""
+        if self.path is not None and self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+
+class CSVSink(_FileSink):
+    """Writes table rows to a CSV file, with the titles as its header row.
+
+    Args:
+        path_or_file (Union[str, Path, TextIO]): Path or fileobject to write to,
+            fileobjects should be opened with `newline=""`.
+        encoding (str, optional): Encoding to open paths with. Defaults to "UTF-8".
+        url (Optional[str], optional): Link to the data from the document.
+            Defaults to the path if it's relative, otherwise no link.
+        **fmtparams: Dialect and formatting parameters, as per `csv.writer`.
+    """
+
+    def __init__(
+        self,
+        path_or_file: Union[str, Path, TextIO],
+        encoding: str = "UTF-8",
+        url: Optional[str] = None,
+        **fmtparams: Any,
+    ):
+        super().__init__(path_or_file, encoding, url)
+        self.fmtparams = fmtparams
+        self._writer = None
+
+    def start(self, titles: list):
+        super().start(titles)
+        self._writer = csv.writer(self.file, **self.fmtparams)
+        self._writer.writerow(titles)
+
+    def write(self, values: list):
+        self._writer.writerow(values)
+
+
+class JSONLSink(_FileSink):
+    """Writes table rows to a JSON Lines file, an object per row keyed by title.
+
+    Args:
+        path_or_file (Union[str, Path, TextIO]): Path or fileobject to write to.
+        encoding (str, optional): Encoding to open paths with. Defaults to "UTF-8".
+        url (Optional[str], optional): Link to the data from the document.
+            Defaults to the path if it's relative, otherwise no link.
+    """
+
+    def write(self, values: list):
+        self.file.write(json.dumps(dict(zip(self.titles, values)), default=str))
+        self.file.write("\n")
@@ -1,15 +1,19 @@
 """Utilities for inline manipulating strings."""
+# Heavy imports are deferred to first use to keep import time down.
+# pylint: disable=import-outside-toplevel
+from __future__ import annotations
 
-import re
+import os
 from contextlib import contextmanager
-from inspect import cleandoc
 from io import StringIO
-from pathlib import Path
-from typing import Generator, Optional, Set, Union
-from urllib.parse import quote as urlquote
 
 from markdown_toolkit import constants
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Generator, Optional, Set, Union
+
 __all__ = [
     "badge",
     "bold",
@@ -26,6 +30,8 @@ __all__ = [
 
 def sanitise_attribute(string) -> str:
     """Converts any string into a safe python attribute string."""
+    import re
+
     return re.sub(r"\W|^(?=\d)", "_", string.casefold())
 
 
@@ -40,7 +46,7 @@ def from_file(path: Union[Path, str], start: int = 1, end: int = None) -> str:
     Returns:
         str: Text block.
     """
-    with open(Path(path), "r", encoding="UTF-8") as file:
+    with open(path, "r", encoding="UTF-8") as file:
         return "".join(file.readlines()[start - 1 : end])
 
 
@@ -56,6 +62,8 @@ def badge(label: str, color: str, message: Optional[str] = None, alt: str = "")
     Returns:
         str: _description_
     """
+    from urllib.parse import quote as urlquote
+
     badge_url = (
         f"https://img.shields.io/static/v1?label="
         f"{urlquote(str(label))}&color={urlquote(str(color))}"
@@ -65,6 +73,44 @@ def badge(label: str, color: str, message: Optional[str] = None, alt: str = "")
     return link(uri="https://shields.io/", text=image(uri=badge_url, text=alt))
 
 
+def cleandoc(text: str) -> str:
+    """Cleans up indentation of multiline text, like `inspect.cleandoc`.
+
+    Single line text, the common case for list items and table cells, only has
+    leading whitespace removed. Multiline text has its margin found in a single
+    pass over the lines.
+
+    Args:
+        text (str): Text to clean up.
+
+    Returns:
+        str: Text without leading whitespace on the first line, common indentation
+            on the remaining lines, or leading and trailing blank lines.
+    """
+    if "\t" in text:
+        text = text.expandtabs()
+    if "\n" not in text:
+        return text.lstrip()
+    lines = text.split("\n")
+    margin = None
+    for line in lines[1:]:
+        content = len(line.lstrip())
+        if content:
+            indent = len(line) - content
+            if margin is None or indent < margin:
+                margin = indent
+    lines[0] = lines[0].lstrip()
+    if margin:
+        lines[1:] = [line[margin:] for line in lines[1:]]
+    start = 0
+    end = len(lines)
+    while end and not lines[end - 1]:
+        end -= 1
+    while start < end and not lines[start]:
+        start += 1
+    return "\n".join(lines[start:end])
+
+
 def list_item(item: str, ordered=False, prefix=None):
     """Returns a list item."""
     if not prefix:
@@ -137,11 +183,24 @@ def remove_duplicates(seq) -> list:
 
 
 @contextmanager
-def fileobj_open(path_or_file: Union[str, StringIO]) -> Generator[StringIO, None, None]:
+def fileobj_open(
+    path_or_file: Union[str, Path, StringIO],
+    mode: str = "r",
+    *,
+    encoding: str = "UTF-8",
+    newline: Optional[str] = None,
+) -> Generator[StringIO, None, None]:
     """Fileobject or Path opener.
 
+    Paths are opened, and closed afterwards, with the given mode. Fileobjects are
+    passed through untouched.
+
     Args:
-        path_or_file (Union[str, StringIO]): Fileobject or Path.
+        path_or_file (Union[str, Path, StringIO]): Fileobject or Path.
+        mode (str, optional): Mode to open paths with. Defaults to "r".
+        encoding (str, optional): Encoding to open paths with. Defaults to "UTF-8".
+        newline (Optional[str], optional): Newline translation for paths, as per
+            `open`. Defaults to None.
 
     Returns:
         StringIO: Document fileobject.
@@ -149,16 +208,15 @@ def fileobj_open(path_or_file: Union[str, StringIO]) -> Generator[StringIO, None
     Yields:
         Iterator[StringIO]: Document fileobject.
     """
-    if isinstance(path_or_file, str):
-        file = file_to_close = open(path_or_file, "r", encoding="UTF-8")
-    elif isinstance(path_or_file, Path):
-        file = file_to_close = open(path_or_file, "r", encoding="UTF-8")
+    if isinstance(path_or_file, (str, os.PathLike)):
+        file = file_to_close = open(
+            path_or_file, mode, encoding=encoding, newline=newline
+        )
     else:
         file = path_or_file
         file_to_close = None
 
     try:
-        print(type(file))
         yield file
     finally:
         if file_to_close:
@@ -0,0 +1,24 @@
+"""Shared pytest configuration."""
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Run tests marked slow, such as throughput tests.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: slow test, only run with --run-slow.")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="Slow test, run with --run-slow.")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
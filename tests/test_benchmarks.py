@@ -0,0 +1,35 @@
+"""Smoke tests for the benchmark suite."""
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.suite import BENCHMARKS, run_benchmarks, summary
+
+
+def test_benchmarks_run():
+    results = run_benchmarks(repeat=1, sizes=(20,))
+    assert [result["name"] for result in results] == [
+        bench.name for bench in BENCHMARKS
+    ]
+    assert all(result["median"] > 0 for result in results)
+    rendered = summary(results).render()
+    assert rendered.startswith("# Benchmark Results")
+    assert "| table.bulk | 20 |" in rendered
+
+
+def test_benchmarks_cli(tmp_path):
+    output = tmp_path / "results.json"
+    markdown = tmp_path / "results.md"
+    main(
+        [
+            "--repeat=1",
+            "--filter=^utils\\.(from_file|sanitise)",
+            f"--output={output}",
+            f"--summary={markdown}",
+        ]
+    )
+    results = json.loads(output.read_text(encoding="UTF-8"))["results"]
+    assert {result["name"] for result in results} == {
+        "utils.from_file",
+        "utils.sanitise_attribute",
+    }
+    assert "utils.from_file" in markdown.read_text(encoding="UTF-8")
@@ -0,0 +1,83 @@
+"""Tests for the benchmarking helpers."""
+import json
+
+import pytest
+
+from markdown_toolkit.bench import compare, measure, quartiles
+from markdown_toolkit.bench.__main__ import main
+
+
+def result(name, median, spread=0.01, peak_memory=1024):
+    return {
+        "name": name,
+        "size": 100,
+        "median": median,
+        "q1": median - spread,
+        "q3": median + spread,
+        "peak_memory": peak_memory,
+    }
+
+
+@pytest.mark.parametrize(
+    "values,expected",
+    [
+        ([1.0], (1.0, 1.0, 1.0)),
+        ([1.0, 2.0, 3.0, 4.0, 5.0], (2.0, 3.0, 4.0)),
+        ([4.0, 1.0, 3.0, 2.0], (1.75, 2.5, 3.25)),
+    ],
+)
+def test_quartiles(values, expected):
+    assert quartiles(values) == expected
+
+
+def test_measure():
+    measurement = measure(lambda: [0] * 100_000, repeat=3)
+    assert len(measurement["timings"]) == 3
+    assert measurement["q1"] <= measurement["median"] <= measurement["q3"]
+    assert measurement["peak_memory"] >= 800_000
+
+
+def test_measure_without_memory():
+    assert measure(lambda: None, repeat=1, memory=False)["peak_memory"] is None
+
+
+def test_compare():
+    base = [
+        result("slower", 1.0),
+        result("noisy", 1.0, spread=0.5),
+        result("faster", 1.0),
+        result("hungrier", 1.0),
+        result("removed", 1.0),
+    ]
+    head = [
+        result("slower", 1.2),
+        result("noisy", 1.2, spread=0.5),
+        result("faster", 0.5),
+        result("hungrier", 1.0, peak_memory=4096),
+        result("added", 1.0),
+    ]
+    statuses = {
+        comparison["name"]: comparison["status"]
+        for comparison in compare(base, head, threshold=0.1)
+    }
+    assert statuses == {
+        "slower": "regression",
+        "noisy": "unchanged",
+        "faster": "improvement",
+        "hungrier": "memory regression",
+    }
+
+
+def test_compare_cli(tmp_path, capsys):
+    base = tmp_path / "base.json"
+    head = tmp_path / "head.json"
+    base.write_text(json.dumps({"results": [result("table", 1.0)]}), encoding="UTF-8")
+    head.write_text(json.dumps({"results": [result("table", 2.0)]}), encoding="UTF-8")
+    assert main(["compare", str(base), str(head)]) == 0
+    assert main(["compare", str(base), str(head), "--fail"]) == 1
+    output = capsys.readouterr().out
+    assert output.startswith("# Benchmark Comparison")
+    assert (
+        "| table | 100 | 1000.00 | 2000.00 | +100.0% | 0.00 MiB | 0.00 MiB "
+        "| **regression** |"
+    ) in output
@@ -0,0 +1,162 @@
+"""Tests for the SectionCache class."""
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from inspect import cleandoc
+from pathlib import Path
+
+import pytest
+from testfixtures import compare
+
+from markdown_toolkit.cache import SectionCache
+from markdown_toolkit.document import MarkdownDocument
+
+BUILT = []
+
+
+def build_account(name, section):
+    BUILT.append(name)
+    with section.heading(name.title()):
+        section.list(name)
+
+
+def render_accounts(cache, names):
+    doc = MarkdownDocument()
+    with doc.heading("Accounts"):
+        for name in names:
+            doc.section(f"Section {name}", partial(build_account, name), cache=cache)
+    return doc.render()
+
+
+def test_section_cache_hits(tmp_path):
+    expected_lines = cleandoc(
+        """
+        # Accounts
+
+        ## Section audit
+
+        ### Audit
+
+        *   audit
+        ## Section billing
+
+        ### Billing
+
+        *   billing
+        """
+    )
+    BUILT.clear()
+    first = render_accounts(SectionCache(tmp_path), ["audit", "billing"])
+    cache = SectionCache(tmp_path)
+    second = render_accounts(cache, ["audit", "billing"])
+    compare(first, expected_lines)
+    compare(second, expected_lines)
+    assert BUILT == ["audit", "billing"]
+    assert cache.stats() == {"hits": 2, "misses": 0, "hit_ratio": 1.0}
+
+
+def test_section_cache_changed_input(tmp_path):
+    BUILT.clear()
+    render_accounts(SectionCache(tmp_path), ["audit", "billing"])
+    cache = SectionCache(tmp_path)
+    render_accounts(cache, ["audit", "logging"])
+    assert BUILT == ["audit", "billing", "logging"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_section_cache_explicit_key(tmp_path):
+    cache = SectionCache(tmp_path)
+    for _ in range(2):
+        doc = MarkdownDocument()
+        doc.section(
+            "Static", lambda section: section.text("Cached."), cache=cache, key="v1"
+        )
+    assert doc.render() == "# Static\n\nCached."
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def static_builder(text):
+    namespace = {}
+    exec(  # pylint: disable=exec-used
+        f"def build_static(section):\n    section.text({text!r})\n", namespace
+    )
+    builder = namespace["build_static"]
+    builder.__module__ = __name__
+    return builder
+
+
+def test_section_cache_changed_literal(tmp_path, monkeypatch):
+    cache = SectionCache(tmp_path)
+    for text in ["First.", "Second."]:
+        builder = static_builder(text)
+        monkeypatch.setattr(
+            sys.modules[__name__], "build_static", builder, raising=False
+        )
+        doc = MarkdownDocument()
+        doc.section("Static", builder, cache=cache)
+        assert doc.render() == f"# Static\n\n{text}"
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_section_cache_version(tmp_path):
+    keys = {
+        SectionCache(tmp_path, version=version).key(partial(build_account, "audit"))
+        for version in ["", "", "2"]
+    }
+    assert len(keys) == 2
+
+
+def build_titled(section, title="A"):
+    section.text(title)
+
+
+def test_section_cache_changed_default(tmp_path, monkeypatch):
+    cache = SectionCache(tmp_path)
+    key = cache.key(build_titled)
+    monkeypatch.setattr(build_titled, "__defaults__", ("B",))
+    assert cache.key(build_titled) != key
+
+
+def test_section_cache_key_hash_seed(tmp_path):
+    script = (
+        "from functools import partial\n"
+        "from markdown_toolkit.cache import SectionCache\n"
+        "from tests.test_markdown_toolkit_cache import build_account\n"
+        f"cache = SectionCache({str(tmp_path)!r})\n"
+        "print(cache.key(partial(build_account, {'audit', 'billing', 'logging'})))\n"
+    )
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            capture_output=True,
+            cwd=Path(__file__).parent.parent,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            text=True,
+        ).stdout
+        for seed in ["1", "2", "3"]
+    }
+    assert len(keys) == 1
+
+
+def test_section_cache_unhashable_builder(tmp_path):
+    doc = MarkdownDocument()
+    with pytest.raises(ValueError):
+        doc.section("Lambda", lambda section: None, cache=SectionCache(tmp_path))
+
+
+def test_sections_cache(tmp_path):
+    BUILT.clear()
+    names = ["audit", "billing", "logging"]
+    sections = [(name, partial(build_account, name)) for name in names]
+    with ThreadPoolExecutor() as executor:
+        first = MarkdownDocument()
+        first.sections(sections[:2], executor=executor, cache=SectionCache(tmp_path))
+        cache = SectionCache(tmp_path)
+        second = MarkdownDocument()
+        second.sections(sections, executor=executor, cache=cache)
+    assert BUILT == names
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert second.render().startswith(first.render())
@@ -1,12 +1,19 @@
 """Tests for the MarkdownDocument class."""
+import asyncio
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from inspect import cleandoc
 from io import StringIO
 from textwrap import dedent
+from types import SimpleNamespace
 
 import pytest
 from testfixtures import compare
 
 from markdown_toolkit.document import MarkdownDocument
+from markdown_toolkit.utils import code
 
 
 def test_linebreak():
@@ -156,6 +163,97 @@ def test_nested_mixed_list():
     assert doc.render() == expected_lines
 
 
+def test_list_tree():
+    expected_lines = cleandoc(
+        """
+        *   One
+            *   A
+                *   i
+        *   Two
+        *   Three
+            *   B
+            *   C
+        """
+    )
+    doc = MarkdownDocument()
+    doc.list_tree({"One": {"A": ["i"]}, "Two": None, "Three": ["B", "C"]})
+    compare(doc.render(), expected=expected_lines)
+
+
+def test_list_tree_matches_nested_lists():
+    nested = MarkdownDocument()
+    with nested.list("One", ordered=True):
+        with nested.list("A", ordered=True):
+            nested.list("i", ordered=True)
+        nested.list("B", ordered=True)
+    with nested.indentblock():
+        with nested.list("Two", ordered=True):
+            nested.list("C", ordered=True)
+
+    doc = MarkdownDocument()
+    doc.list_tree([{"One": [{"A": "i"}, "B"]}], ordered=True)
+    with doc.indentblock():
+        doc.list_tree({"Two": ["C"]}, ordered=True)
+    compare(doc.render(), expected=nested.render())
+
+
+def test_list_tree_inside_list():
+    expected_lines = cleandoc(
+        """
+        -   Parent
+            -   One
+                -   A
+        """
+    )
+    doc = MarkdownDocument()
+    with doc.list("Parent", prefix="-"):
+        doc.list_tree({"One": ["A"]}, prefix="-")
+    compare(doc.render(), expected=expected_lines)
+
+
+def test_list_tree_objects():
+    expected_lines = cleandoc(
+        """
+        *   markdown-toolkit
+            *   testfixtures
+            *   pytest
+                *   pluggy
+        """
+    )
+    tree = {
+        "name": "markdown-toolkit",
+        "dependencies": [
+            {"name": "testfixtures", "dependencies": []},
+            {"name": "pytest", "dependencies": [{"name": "pluggy"}]},
+        ],
+    }
+    doc = MarkdownDocument()
+    doc.list_tree([tree], key="name", children=lambda node: node.get("dependencies"))
+    compare(doc.render(), expected=expected_lines)
+
+
+def test_list_tree_deep():
+    depth = 5_000
+    tree = leaf = {}
+    for idx in range(depth):
+        leaf[f"Item {idx}"] = leaf = {}
+    doc = MarkdownDocument()
+    doc.list_tree(tree)
+    lines = doc.render().splitlines()
+    assert len(lines) == depth
+    assert lines[-1] == " " * 4 * (depth - 1) + f"*   Item {depth - 1}"
+
+
+def test_element_slots():
+    doc = MarkdownDocument()
+    with doc.heading("Heading") as heading, doc.table(titles=["Title"]) as table:
+        elements = [heading, table, doc.list("Item")]
+    doc.include(MarkdownDocument())
+    elements.append(doc._buffer[-1])
+    for element in elements:
+        assert not hasattr(element, "__dict__"), type(element).__name__
+
+
 def test_horizontal_line():
     expected_lines = cleandoc(
         """
@@ -358,6 +456,660 @@ def test_table_bulk_add_rows():
     compare(doc.render(), expected_lines)
 
 
+def test_table_bulk_add_rows_iterator():
+    expected_lines = cleandoc(
+        """
+        | Apple Type | Grown Count |
+        | --- | --- |
+        | Golden Delicious | 2 |
+        | Granny Smith | 3 |
+        """
+    )
+    raw_table = [
+        {"Apple Type": "Golden Delicious", "Grown Count": 2},
+        {"Apple Type": "Granny Smith", "Grown Count": 3},
+        {"Apple Type": "Granny Smith", "Grown Count": 3},
+    ]
+    doc = MarkdownDocument()
+    doc.table(row for row in raw_table[:2])
+    doc.table((row for row in raw_table), unique=True, page_size=5)
+    compare(doc.render(), expected=f"{expected_lines}\n\n{expected_lines}\n")
+
+
+def test_table_bulk_add_rows_titles():
+    expected_lines = cleandoc(
+        """
+        | name | email |
+        | --- | --- |
+        | Alice | alice@example.com |
+        """
+    )
+    doc = MarkdownDocument()
+    doc.table(
+        iter([{"name": "Alice", "email": "alice@example.com"}]),
+        titles=["Name", "Email"],
+    )
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_table_projection():
+    expected_lines = cleandoc(
+        """
+        | Apple | Cost |
+        | --- | --- |
+        | `Granny Smith` | $1,200.50 |
+        | `Pink Lady` | $3.00 |
+
+        | Apple Type | Grown Count |
+        | --- | --- |
+        | Granny Smith | 3 |
+        """
+    )
+    raw_table = [
+        {"type": "Golden Delicious", "count": 2, "cost": 0, "origin": "US"},
+        {"type": "Granny Smith", "count": 3, "cost": 1200.5, "origin": "AU"},
+        {"type": "Pink Lady", "count": 5, "cost": 3, "origin": "AU"},
+    ]
+    doc = MarkdownDocument()
+    doc.table(
+        iter(raw_table),
+        columns=["type", "cost"],
+        titles=["Apple", "Cost"],
+        where=lambda row: row["cost"] > 0,
+        formatters={"Apple": code, "Cost": "${:,.2f}".format},
+    )
+    with doc.table(
+        titles=["Apple Type", "Grown Count"],
+        columns=["type", "count"],
+        where=lambda row: row["origin"] == "AU",
+    ) as table:
+        table.bulk_add_rows(raw_table[:2])
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_table_projection_mismatched_columns():
+    doc = MarkdownDocument()
+    with pytest.raises(ValueError):
+        doc.table(titles=["Apple", "Cost"], columns=["type"])
+    with pytest.raises(ValueError):
+        doc.table([{"type": "Pink Lady"}], titles=["Apple"], columns=["type", "cost"])
+
+
+def test_table_formatters_add_row():
+    expected_lines = cleandoc(
+        """
+        | Apple Type | Share |
+        | --- | --- |
+        | Golden Delicious | 25% |
+        | Granny Smith |  |
+        """
+    )
+    doc = MarkdownDocument()
+    with doc.table(
+        titles=["Apple Type", "Share"], formatters={"Share": "{:.0%}".format}
+    ) as table:
+        table.add_row(apple_type="Golden Delicious", share=0.25)
+        table.add_row(apple_type="Granny Smith")
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_table_formatter_missing_title():
+    doc = MarkdownDocument()
+    with pytest.raises(ValueError):
+        doc.table(titles=["Apple Type"], formatters={"Cost": str})
+
+
+def test_table_aggregates():
+    expected_lines = cleandoc(
+        """
+        | Apple Type | Grown Count | Cost |
+        | --- | --- | --- |
+        | Golden Delicious | 2 | $1.50 |
+        | Granny Smith | 3 | $2.25 |
+        | Pink Lady | unknown | $3.00 |
+        | **Count**: 3 | 3 |  |
+        | **Sum** | 5 | $6.75 |
+        | **Min** | 2 |  |
+        | **Mean** |  | $2.25 |
+        """
+    )
+    raw_table = [
+        {"Apple Type": "Golden Delicious", "Grown Count": 2, "Cost": 1.5},
+        {"Apple Type": "Granny Smith", "Grown Count": "3", "Cost": 2.25},
+        {"Apple Type": "Pink Lady", "Grown Count": "unknown", "Cost": 3},
+    ]
+    doc = MarkdownDocument()
+    doc.table(
+        iter(raw_table),
+        titles=["Apple Type", "Grown Count", "Cost"],
+        formatters={"Cost": "${:,.2f}".format},
+        aggregates={
+            "Apple Type": "count",
+            "Grown Count": ["count", "sum", "min"],
+            "Cost": ["sum", "mean"],
+        },
+    )
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_table_aggregates_add_row():
+    expected_lines = cleandoc(
+        """
+        | Apple Type | Grown Count |
+        | --- | --- |
+        | Granny Smith | 3 |
+        | Golden Delicious |  |
+        | **Max** | 3 |
+        """
+    )
+    doc = MarkdownDocument()
+    with doc.table(
+        titles=["Apple Type", "Grown Count"], aggregates={"Grown Count": "max"}
+    ) as table:
+        table.add_row(apple_type="Granny Smith", grown_count=3)
+        table.add_row(apple_type="Golden Delicious")
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_table_aggregates_invalid():
+    doc = MarkdownDocument()
+    with pytest.raises(ValueError):
+        doc.table(titles=["Apple Type"], aggregates={"Cost": "sum"})
+    with pytest.raises(ValueError):
+        doc.table(titles=["Apple Type"], aggregates={"Apple Type": "median"})
+
+
+def test_table_unique():
+    expected_lines = cleandoc(
+        """
+        | Apple Type | Grown Count |
+        | --- | --- |
+        | Golden Delicious | 2 |
+        | Granny Smith | 3 |
+        | Granny Smith | 4 |
+        | **Sum** | 9 |
+
+        | Apple Type | Grown Count |
+        | --- | --- |
+        | Golden Delicious | 2 |
+        | Granny Smith | 3 |
+        """
+    )
+    raw_table = [
+        {"Apple Type": "Golden Delicious", "Grown Count": 2},
+        {"Apple Type": "Granny Smith", "Grown Count": 3},
+        {"Apple Type": "Golden Delicious", "Grown Count": 2},
+        {"Apple Type": "Granny Smith", "Grown Count": 4},
+    ]
+    doc = MarkdownDocument()
+    doc.table(raw_table, unique=True, aggregates={"Grown Count": "sum"})
+    with doc.table(
+        titles=["Apple Type", "Grown Count"], unique_on=["Apple Type"]
+    ) as table:
+        table.add_row(apple_type="Golden Delicious", grown_count=2)
+        table.bulk_add_rows(raw_table[1:])
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_table_pages_split():
+    expected_lines = cleandoc(
+        """
+        | Apple Type | Grown Count |
+        | --- | --- |
+        | Apple 0 | 0 |
+        | Apple 1 | 1 |
+
+        | Apple Type | Grown Count |
+        | --- | --- |
+        | Apple 2 | 2 |
+        | Apple 3 | 3 |
+
+        | Apple Type | Grown Count |
+        | --- | --- |
+        | Apple 4 | 4 |
+        | **Sum** | 10 |
+        """
+    )
+    rows = ({"Apple Type": f"Apple {idx}", "Grown Count": idx} for idx in range(5))
+    doc = MarkdownDocument()
+    doc.table(
+        rows,
+        titles=["Apple Type", "Grown Count"],
+        aggregates={"Grown Count": "sum"},
+        page_size=2,
+    )
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_table_pages_collapsed():
+    expected_lines = cleandoc(
+        """
+        <details><summary>Rows 1 to 2</summary>
+
+        | Apple Type |
+        | --- |
+        | Apple 0 |
+        | Apple 1 |
+
+        </details>
+
+
+        <details><summary>Rows 3 to 3</summary>
+
+        | Apple Type |
+        | --- |
+        | Apple 2 |
+
+        </details>
+        """
+    )
+    doc = MarkdownDocument()
+    with doc.table(titles=["Apple Type"], page_size=2, paginate="collapsed") as table:
+        for idx in range(3):
+            table.add_row(apple_type=f"Apple {idx}")
+        assert len(table.rows) == 1
+    compare(doc.render(), expected="\n" + expected_lines + "\n")
+
+
+def test_table_pages_sorted():
+    doc = MarkdownDocument()
+    with pytest.raises(ValueError):
+        doc.table(titles=["Apple Type"], sort_by="Apple Type", page_size=2)
+    with pytest.raises(ValueError):
+        doc.table(titles=["Apple Type"], page_size=2, paginate="tabs")
+    with pytest.raises(ValueError):
+        doc.table(titles=["Apple Type"], page_size=0)
+
+
+COSTS = [
+    {"Account": "web", "Month": "Jan", "Cost": 10},
+    {"Account": "api", "Month": "Jan", "Cost": 5},
+    {"Account": "web", "Month": "Feb", "Cost": 12},
+    {"Account": "web", "Month": "Jan", "Cost": 3},
+]
+
+
+def test_pivot_table():
+    expected_lines = cleandoc(
+        """
+        | Account | Jan | Feb |
+        | --- | --- | --- |
+        | web | 13 | 12 |
+        | api | 5 | - |
+
+        | Month | web | api |
+        | --- | --- | --- |
+        | Feb | 1 |  |
+        | Jan | 2 | 1 |
+
+        |  | web | api |
+        | --- | --- | --- |
+        | Jan | 6.5 | 5.0 |
+        | Feb | 12.0 |  |
+        """
+    )
+    doc = MarkdownDocument()
+    doc.pivot_table(
+        iter(COSTS), index="Account", columns="Month", values="Cost", fill="-"
+    )
+    doc.pivot_table(COSTS, index="Month", columns="Account", agg=len, sort_by="Month")
+    doc.pivot_table(
+        COSTS,
+        index=lambda row: row["Month"],
+        columns="Account",
+        values="Cost",
+        agg=lambda values: sum(values) / len(values),
+    )
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_pivot_table_string_values():
+    doc = MarkdownDocument()
+    with pytest.raises(TypeError):
+        doc.pivot_table(
+            [{"Month": "Jan", "Cost": "1.5"}, {"Month": "Jan", "Cost": "2"}],
+            index="Month",
+            columns="Month",
+            values="Cost",
+        )
+
+
+def test_pivot_table_without_values():
+    doc = MarkdownDocument()
+    with pytest.raises(ValueError):
+        doc.pivot_table(COSTS, index="Account", columns="Month")
+    compare(doc.render(), expected="")
+
+
+def test_hierarchy():
+    expected_lines = cleandoc(
+        """
+        # Root
+
+        | Account | Cost |
+        | --- | --- |
+        | management | 10 |
+
+        ## Workloads
+
+        ### Production
+
+        | Account | Cost |
+        | --- | --- |
+        | web | 20 |
+        | api | 30 |
+
+        ## Sandbox
+        """
+    )
+    tree = {
+        "name": "Root",
+        "rows": [{"Account": "management", "Cost": 10}],
+        "children": [
+            {
+                "name": "Workloads",
+                "rows": [],
+                "children": [
+                    {
+                        "name": "Production",
+                        "rows": [
+                            {"Account": "web", "Cost": 20},
+                            {"Account": "api", "Cost": 30},
+                        ],
+                    }
+                ],
+            },
+            {"name": "Sandbox"},
+        ],
+    }
+    doc = MarkdownDocument()
+    doc.hierarchy(tree)
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_hierarchy_matches_nested_headings():
+    def org_unit(name, depth):
+        rows = ({"Account": f"{name}-{idx}"} for idx in range(depth))
+        children = (org_unit(f"{name}.{idx}", depth - 1) for idx in range(depth))
+        return SimpleNamespace(title=name, accounts=rows, units=children)
+
+    def add(doc, unit):
+        with doc.heading(unit.title):
+            accounts = list(unit.accounts)
+            if accounts:
+                doc.table(accounts)
+            for child in unit.units:
+                add(doc, child)
+
+    nested = MarkdownDocument()
+    with nested.heading("Organisation"):
+        add(nested, org_unit("root", 3))
+
+    doc = MarkdownDocument()
+    with doc.heading("Organisation"):
+        doc.hierarchy(
+            [org_unit("root", 3)],
+            heading_key="title",
+            rows_key="accounts",
+            children_key=lambda unit: unit.units,
+            titles=["Account"],
+        )
+    compare(doc.render(), expected=nested.render())
+
+
+def test_hierarchy_deep():
+    depth = 5_000
+    tree = node = {"name": "Level 0"}
+    for idx in range(1, depth):
+        node["children"] = [{"name": f"Level {idx}"}]
+        node = node["children"][0]
+    doc = MarkdownDocument()
+    doc.hierarchy(tree)
+    assert doc.render().splitlines()[-1] == "#" * depth + f" Level {depth - 1}"
+
+
+CSV_TABLE = """Account,Owner,Cost\r
+web,"Platform, Web",20\r
+api,Platform,30\r
+test,Sandbox,5\r
+"""
+
+
+def test_table_from_csv(tmp_path):
+    expected_lines = cleandoc(
+        """
+        | Account | Owner | Cost |
+        | --- | --- | --- |
+        | web | Platform, Web | 20 |
+        | api | Platform | 30 |
+        | test | Sandbox | 5 |
+        """
+    )
+    path = tmp_path / "table.csv"
+    path.write_text(CSV_TABLE, encoding="UTF-8")
+    doc = MarkdownDocument()
+    doc.table_from_csv(path, batch_size=2)
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_table_from_csv_columns():
+    expected_lines = cleandoc(
+        """
+        | Cost | Account |
+        | --- | --- |
+        | 20 | web |
+        | 30 | api |
+
+        | Account |
+        | --- |
+        | api |
+        | test |
+        | web |
+        """
+    )
+    doc = MarkdownDocument()
+    doc.table_from_csv(StringIO(CSV_TABLE), columns=["Cost", "Account"], limit=2)
+    doc.table_from_csv(StringIO(CSV_TABLE), columns=["Account"], sort_by="Account")
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_table_from_csv_short_rows():
+    expected_lines = cleandoc(
+        """
+        | Cost | Account |
+        | --- | --- |
+        | 20 | web |
+        |  | api |
+        """
+    )
+    doc = MarkdownDocument()
+    doc.table_from_csv(StringIO(""))
+    doc.table_from_csv(
+        StringIO("\nAccount,Owner,Cost\nweb,Platform,20\n\napi\n"),
+        columns=["Cost", "Account"],
+    )
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_table_from_csv_missing_column():
+    doc = MarkdownDocument()
+    with pytest.raises(ValueError):
+        doc.table_from_csv(StringIO(CSV_TABLE), columns=["Region"])
+
+
+JSONL_TABLE = """{"time": 1, "event": {"type": "start", "host": "web"}}
+{"time": 2, "event": {"type": "stop", "host": null}}
+
+{"time": 3, "event": {"type": "start", "host": "api"}, "user": "admin"}
+"""
+
+JSONL_VALUES = """{"active": true, "tags": ["a", "b"], "cost": 1.5, "name": "web"}
+"""
+
+
+def test_table_from_jsonl(tmp_path):
+    expected_lines = cleandoc(
+        """
+        | time | event.type | event.host |
+        | --- | --- | --- |
+        | 1 | start | web |
+        | 2 | stop | - |
+        | 3 | start | api |
+        """
+    )
+    path = tmp_path / "table.jsonl"
+    path.write_text(JSONL_TABLE, encoding="UTF-8")
+    doc = MarkdownDocument()
+    doc.table_from_jsonl(path, sample=2, default="-")
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_table_from_jsonl_columns():
+    expected_lines = cleandoc(
+        """
+        | user | event.host | event |
+        | --- | --- | --- |
+        |  | web | {"type": "start", "host": "web"} |
+        |  |  | {"type": "stop", "host": null} |
+        | admin | api | {"type": "start", "host": "api"} |
+        """
+    )
+    doc = MarkdownDocument()
+    doc.table_from_jsonl(StringIO(JSONL_TABLE), ["user", "event.host", "event"])
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_table_from_jsonl_values():
+    expected_lines = cleandoc(
+        """
+        | active | tags | cost | name |
+        | --- | --- | --- | --- |
+        | true | ["a", "b"] | 1.5 | web |
+        """
+    )
+    doc = MarkdownDocument()
+    doc.table_from_jsonl(StringIO(JSONL_VALUES))
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_table_from_cursor():
+    expected_lines = cleandoc(
+        """
+        | account | cost |
+        | --- | --- |
+        | api | 30.5 |
+        | test |  |
+        | web | 20.0 |
+        """
+    )
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE costs (account TEXT, cost REAL)")
+    connection.executemany(
+        "INSERT INTO costs VALUES (?, ?)", [("web", 20), ("api", 30.5), ("test", None)]
+    )
+    doc = MarkdownDocument()
+    cursor = connection.execute("SELECT account, cost FROM costs")
+    doc.table_from_cursor(cursor, batch_size=2, sort_by="account")
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+@pytest.mark.slow
+def test_table_from_cursor_throughput(record_property):
+    rows = 1_000_000
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE costs (account TEXT, owner TEXT, cost REAL)")
+    connection.execute(
+        f"""
+        WITH RECURSIVE idx(value) AS (
+            SELECT 0 UNION ALL SELECT value + 1 FROM idx WHERE value < {rows - 1}
+        )
+        INSERT INTO costs SELECT 'account-' || value, 'team-' || (value % 50),
+            value * 1.5 FROM idx
+        """
+    )
+    doc = MarkdownDocument()
+    start = time.perf_counter()
+    doc.table_from_cursor(connection.execute("SELECT * FROM costs"))
+    rows_per_second = rows / (time.perf_counter() - start)
+    record_property("rows_per_second", round(rows_per_second))
+    lines = doc.render().splitlines()
+    assert len(lines) == rows + 2
+    assert lines[-1] == f"| account-{rows - 1} | team-49 | {(rows - 1) * 1.5} |"
+
+
+def test_grouped_tables():
+    expected_lines = cleandoc(
+        """
+        # Production
+
+        | Account | OU |
+        | --- | --- |
+        | api | Production |
+        | web | Production |
+
+        # Sandbox
+
+        | Account | OU |
+        | --- | --- |
+        | test | Sandbox |
+        """
+    )
+    rows = (
+        {"Account": "web", "OU": "Production"},
+        {"Account": "test", "OU": "Sandbox"},
+        {"Account": "api", "OU": "Production"},
+    )
+    doc = MarkdownDocument()
+    doc.grouped_tables(rows, by="OU", sort_by="Account")
+    compare(doc.render(), expected=expected_lines + "\n")
+
+
+def test_grouped_tables_spill():
+    rows = [{"Account": f"account-{idx}", "Cost": idx} for idx in range(100)]
+    expected = MarkdownDocument()
+    for parity in (0, 1):
+        with expected.heading(str(parity)):
+            expected.table([row for row in rows if row["Cost"] % 2 == parity])
+
+    doc = MarkdownDocument()
+    doc.grouped_tables(
+        iter(rows), by=lambda row: row["Cost"] % 2, titles=["Account"], spill_after=7
+    )
+    doc_with_titles = doc.render()
+    doc = MarkdownDocument()
+    doc.grouped_tables(iter(rows), by=lambda row: row["Cost"] % 2, spill_after=7)
+    compare(doc.render(), expected=expected.render())
+    assert "| Account |\n| --- |\n| account-0 |\n" in doc_with_titles
+
+
+def test_grouped_tables_spill_file(monkeypatch):
+    import tempfile
+
+    files = []
+
+    def temporary_file(*args, **kwargs):
+        files.append(temporary_file.open(*args, **kwargs))
+        return files[-1]
+
+    def failing_rows():
+        yield from ({"Account": f"account-{idx}", "OU": idx % 5} for idx in range(50))
+        raise RuntimeError("Source failed.")
+
+    temporary_file.open = tempfile.TemporaryFile
+    monkeypatch.setattr(tempfile, "TemporaryFile", temporary_file)
+    doc = MarkdownDocument()
+    with pytest.raises(RuntimeError):
+        doc.grouped_tables(failing_rows(), by="OU", spill_after=2)
+    assert len(files) == 1
+    assert files[0].closed
+
+
+def test_grouped_tables_spill_sorted():
+    doc = MarkdownDocument()
+    with pytest.raises(ValueError):
+        doc.grouped_tables([], by="OU", sort_by="Account", spill_after=10)
+
+
 def test_collapsed_section():
     expected_lines = (
         "\n"
@@ -393,3 +1145,262 @@ def test_document_write():
     doc.write(file_object)
     file_object.seek(0)
     assert file_object.read() == expected_lines
+
+
+def test_include():
+    expected_lines = cleandoc(
+        """
+        # Report
+
+        ## Section
+
+        Section content.
+
+        EOF
+        """
+    )
+    section = MarkdownDocument()
+    with section.heading("Section"):
+        section.paragraph("Section content.")
+    doc = MarkdownDocument()
+    with doc.heading("Report"):
+        doc.include(section)
+    doc.add("EOF")
+    compare(doc.render(), expected_lines)
+
+
+def test_include_indented():
+    expected_lines = cleandoc(
+        """
+        *   Parent
+            *   Child
+                *   Grandchild
+        *   Sibling
+        """
+    )
+    section = MarkdownDocument()
+    with section.list("Child"):
+        section.list("Grandchild")
+    doc = MarkdownDocument()
+    with doc.list("Parent"):
+        doc.include(section)
+    doc.list("Sibling")
+    compare(doc.render(), expected_lines)
+
+
+def test_include_is_lazy():
+    section = MarkdownDocument()
+    doc = MarkdownDocument()
+    doc.include(section)
+    section.text("Added after include.")
+    assert doc.render() == "Added after include."
+
+
+def test_include_nested():
+    expected_lines = cleandoc(
+        """
+        # Outer
+
+        ## Middle
+
+        ### Inner
+        """
+    )
+    inner = MarkdownDocument()
+    with inner.heading("Inner"):
+        pass
+    middle = MarkdownDocument()
+    with middle.heading("Middle"):
+        middle.include(inner)
+    doc = MarkdownDocument()
+    with doc.heading("Outer"):
+        doc.include(middle)
+    compare(doc.render(), expected_lines + "\n")
+
+
+def test_include_self():
+    doc = MarkdownDocument()
+    with pytest.raises(ValueError):
+        doc.include(doc)
+
+
+def test_include_cycle():
+    first = MarkdownDocument()
+    second = MarkdownDocument()
+    first.include(second)
+    second.include(first)
+    with pytest.raises(ValueError):
+        first.render()
+
+
+def test_include_twice():
+    section = MarkdownDocument()
+    section.text("Shared.")
+    doc = MarkdownDocument()
+    doc.include(section)
+    doc.include(section)
+    compare(doc.render(), "Shared.\nShared.")
+
+
+def build_numbered_section(number, section):
+    with section.heading(f"Item {number}"):
+        section.paragraph(f"Content {number}.")
+
+
+def test_sections():
+    expected_lines = cleandoc(
+        """
+        # Report
+
+        ## Section 0
+
+        ### Item 0
+
+        Content 0.
+
+        ## Section 1
+
+        ### Item 1
+
+        Content 1.
+
+        ## Section 2
+
+        ### Item 2
+
+        Content 2.
+        """
+    )
+    doc = MarkdownDocument()
+    with doc.heading("Report"):
+        doc.sections(
+            (f"Section {number}", partial(build_numbered_section, number))
+            for number in range(3)
+        )
+    compare(doc.render(), expected_lines + "\n")
+
+
+def test_sections_thread_executor():
+    doc = MarkdownDocument()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        doc.sections(
+            [(f"Section {number}", lambda section: None) for number in range(10)],
+            executor=executor,
+        )
+    headings = doc.render().splitlines()[::2]
+    assert headings == [f"# Section {number}" for number in range(10)]
+
+
+def test_asection():
+    async def build_slow(section):
+        await asyncio.sleep(0.02)
+        section.text("Slow.")
+
+    async def build_fast(section):
+        section.text("Fast.")
+
+    async def build_document():
+        doc = MarkdownDocument()
+        await asyncio.gather(
+            doc.asection("Slow", build_slow), doc.asection("Fast", build_fast)
+        )
+        return doc
+
+    expected_lines = cleandoc(
+        """
+        # Slow
+
+        Slow.
+        # Fast
+
+        Fast.
+        """
+    )
+    compare(asyncio.run(build_document()).render(), expected_lines)
+
+
+def test_asections_limit():
+    running = []
+    peak = []
+
+    async def build(number, section):
+        running.append(number)
+        peak.append(len(running))
+        await asyncio.sleep(0.01 * (5 - number % 5))
+        running.remove(number)
+        section.text(str(number))
+
+    doc = MarkdownDocument()
+    asyncio.run(
+        doc.asections(
+            ((f"Section {number}", partial(build, number)) for number in range(20)),
+            limit=5,
+        )
+    )
+    assert max(peak) == 5
+    assert doc.render().splitlines()[::3] == [
+        f"# Section {number}" for number in range(20)
+    ]
+
+
+def test_document_write_path(tmp_path, capsys):
+    expected_lines = "# Title\n\n" + "\n".join(f"*   {idx}" for idx in range(3000))
+    doc = MarkdownDocument()
+    with doc.heading("Title"):
+        for idx in range(3000):
+            doc.list(str(idx))
+    doc.write(tmp_path / "document.md", chunk_size=100)
+    doc.write(str(tmp_path / "trailing.md"), trailing_whitespace=True)
+    compare((tmp_path / "document.md").read_text(encoding="UTF-8"), expected_lines)
+    compare(
+        (tmp_path / "trailing.md").read_text(encoding="UTF-8"), expected_lines + "\n"
+    )
+    assert capsys.readouterr().out == ""
+
+
+def test_document_write_encoding(tmp_path):
+    doc = MarkdownDocument()
+    doc.text("Café")
+    doc.text("Crème")
+    doc.write(tmp_path / "document.md", encoding="latin-1", newline="\r\n")
+    assert (tmp_path / "document.md").read_bytes() == "Café\r\nCrème".encode("latin-1")
+
+
+def test_document_write_atomic(tmp_path):
+    path = tmp_path / "document.md"
+    path.write_text("Old content.", encoding="UTF-8")
+    path.chmod(0o640)
+    doc = MarkdownDocument()
+    doc.text("New content.")
+    doc.write(path, atomic=True)
+    assert path.read_text(encoding="UTF-8") == "New content."
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert [file.name for file in tmp_path.iterdir()] == ["document.md"]
+
+
+def test_document_write_atomic_new_file(tmp_path):
+    doc = MarkdownDocument()
+    doc.text("New content.")
+    doc.write(tmp_path / "atomic.md", atomic=True)
+    doc.write(tmp_path / "plain.md")
+    assert (tmp_path / "atomic.md").read_text(encoding="UTF-8") == "New content."
+    compare(
+        (tmp_path / "atomic.md").stat().st_mode, (tmp_path / "plain.md").stat().st_mode
+    )
+
+
+def test_document_write_atomic_fileobj():
+    doc = MarkdownDocument()
+    with pytest.raises(ValueError):
+        doc.write(StringIO(), atomic=True)
+
+
+def test_document_write_include():
+    section = MarkdownDocument()
+    section.text("Included.")
+    doc = MarkdownDocument()
+    with doc.list("Parent"):
+        doc.include(section)
+    file_object = StringIO()
+    doc.write(file_object)
+    assert file_object.getvalue() == doc.render()
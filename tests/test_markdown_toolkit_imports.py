@@ -0,0 +1,77 @@
+"""Tests for the package import time."""
+import platform
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import markdown_toolkit
+from markdown_toolkit import utils
+
+RELATIVE_PATH = Path(__file__).parent
+
+IMPORT_BUDGET_MICROSECONDS = 30_000
+
+
+def imported_modules(statement: str) -> dict:
+    """Modules imported by a statement, with cumulative microseconds of top level ones.
+
+    Nested imports are included with a cumulative time of zero, as they are already
+    counted by the import that triggered them.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True,
+        capture_output=True,
+        cwd=RELATIVE_PATH.parent,
+        text=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            nested = name.startswith("  ")
+            modules[name.strip()] = 0 if nested else int(cumulative)
+    return modules
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != "CPython", reason="-X importtime is CPython"
+)
+def test_import_time_budget():
+    startup = imported_modules("pass")
+    best = min(
+        sum(
+            cumulative
+            for name, cumulative in imported_modules(
+                "from markdown_toolkit import MarkdownDocument"
+            ).items()
+            if name not in startup
+        )
+        for _ in range(3)
+    )
+    assert best < IMPORT_BUDGET_MICROSECONDS
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import markdown_toolkit",
+        "from markdown_toolkit import MarkdownDocument",
+        "from markdown_toolkit import bold, header, link",
+    ],
+)
+def test_heavy_modules_deferred(statement):
+    modules = imported_modules(statement)
+    for heavy in ("asyncio", "concurrent", "inspect", "pathlib", "tempfile", "typing"):
+        assert heavy not in modules
+
+
+def test_lazy_attributes():
+    for name in markdown_toolkit.__all__:
+        assert getattr(markdown_toolkit, name) is not None
+    assert set(utils.__all__) <= set(markdown_toolkit.__all__)
+    assert set(markdown_toolkit.__all__) <= set(dir(markdown_toolkit))
+    with pytest.raises(AttributeError):
+        getattr(markdown_toolkit, "missing")
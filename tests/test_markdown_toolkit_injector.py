@@ -487,3 +487,18 @@ def test_anchor_delete():
     document = MarkdownInjector(source_document)
     del document.anchors.dynamicblock.value
     compare(document.render(trailing_whitespace=False), expected_result)
+
+
+def test_anchor_slots():
+    source_document = StringIO(
+        cleandoc(
+            """
+            <!--- markdown-toolkit:dynamicblock --->
+            <!--- markdown-toolkit:dynamicblock --->
+            """
+        )
+    )
+    anchor = MarkdownInjector(source_document).anchors.dynamicblock
+    assert not hasattr(anchor, "__dict__")
+    with pytest.raises(AttributeError):
+        anchor.unknown = True
@@ -0,0 +1,83 @@
+"""Tests for the instrumentation of documents and injectors."""
+from inspect import cleandoc
+from io import StringIO
+
+from markdown_toolkit.document import MarkdownDocument
+from markdown_toolkit.injector import MarkdownAnchor, MarkdownInjector
+from markdown_toolkit.instrumentation import Instrumentation
+
+
+def test_document_stats():
+    doc = MarkdownDocument(instrumentation=Instrumentation())
+    doc.paragraph("First.")
+    doc.text("Second.")
+    with doc.table(titles=["Name"]) as table:
+        table.add_row(name="Row")
+    doc.table([{"Name": "Row"}, {"Name": "Another Row"}])
+    doc.render()
+    calls = {name: stat["calls"] for name, stat in doc.stats().items()}
+    assert calls == {
+        "MarkdownDocument.paragraph": 3,
+        "MarkdownDocument.render": 1,
+        "MarkdownDocument.text": 9,
+        "MarkdownTable._render": 2,
+        "MarkdownTable.add_row": 1,
+        "MarkdownTable.bulk_add_rows": 1,
+    }
+    assert all(stat["seconds"] >= 0 for stat in doc.stats().values())
+
+
+def test_document_instrumented_output():
+    plain = MarkdownDocument()
+    instrumented = MarkdownDocument(instrumentation=Instrumentation())
+    for doc in (plain, instrumented):
+        with doc.heading("Title"):
+            doc.paragraph("Text.")
+            doc.table([{"Name": "Row"}])
+    assert isinstance(instrumented, MarkdownDocument)
+    assert instrumented.render() == plain.render()
+
+
+def test_document_without_instrumentation():
+    doc = MarkdownDocument()
+    doc.paragraph("Text.")
+    assert type(doc) is MarkdownDocument
+    assert doc.stats() == {}
+
+
+def test_injector_stats():
+    recorded = []
+    source = StringIO(
+        cleandoc(
+            """
+            <!--- markdown-toolkit:block --->
+            <!--- markdown-toolkit:block --->
+            """
+        )
+    )
+    injector = MarkdownInjector(
+        source,
+        instrumentation=Instrumentation(
+            callback=lambda name, seconds: recorded.append(name)
+        ),
+    )
+    injector.anchors.block.value = "Replaced."
+    assert injector.anchors.block.value == "Replaced."
+    del injector.anchors.block.value
+    assert isinstance(injector.anchors.block, MarkdownAnchor)
+    assert recorded == [
+        "MarkdownInjector._find_anchors",
+        "MarkdownAnchor._index_finder",
+        "MarkdownAnchor.value.setter",
+        "MarkdownAnchor._index_finder",
+        "MarkdownAnchor.value",
+        "MarkdownAnchor._index_finder",
+        "MarkdownAnchor.value.deleter",
+    ]
+    assert injector.stats()["MarkdownAnchor._index_finder"]["calls"] == 3
+
+
+def test_injector_without_instrumentation():
+    injector = MarkdownInjector(StringIO("Text."))
+    assert type(injector) is MarkdownInjector
+    assert injector.stats() == {}
@@ -0,0 +1,73 @@
+"""Tests for the profiling helpers."""
+import os
+import subprocess
+import sys
+from io import StringIO
+from pathlib import Path
+
+from markdown_toolkit.document import MarkdownDocument
+from markdown_toolkit.profiling import profile
+
+RELATIVE_PATH = Path(__file__).parent
+
+
+def build_document(lines):
+    doc = MarkdownDocument()
+    with doc.heading("Title"):
+        for idx in range(lines):
+            doc.text(f"Line {idx}")
+    return doc.render()
+
+
+def test_profile_report():
+    report = StringIO()
+    with profile(report, top=5) as session:
+        build_document(1_000)
+    assert session.lines_produced() == 1_002
+    rendered = report.getvalue()
+    assert rendered.startswith("# Markdown Toolkit Profile")
+    assert "| Lines produced | 1,002 |" in rendered
+    assert "## Top Functions by Cumulative Time" in rendered
+    assert "document.py" in rendered
+    assert "## Top Allocation Sites" in rendered
+
+
+def test_profile_lines_produced():
+    with profile(None) as session:
+        doc = MarkdownDocument()
+        doc.list_tree({"Root": ["First", "Second"]})
+        section = MarkdownDocument()
+        with section.heading("Section"):
+            pass
+        doc.include(section)
+    assert session.lines_produced() == len(doc.render().split("\n"))
+
+
+def test_profile_without_output():
+    with profile(None) as session:
+        build_document(10)
+    assert session.peak_memory > 0
+    assert session.report().render().count("\n| ") >= 4
+
+
+def test_profile_environment(tmp_path):
+    output = tmp_path / "profile.md"
+    environment = dict(
+        os.environ,
+        MARKDOWN_TOOLKIT_PROFILE="1",
+        MARKDOWN_TOOLKIT_PROFILE_OUTPUT=str(output),
+    )
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from markdown_toolkit import MarkdownDocument\n"
+            "doc = MarkdownDocument()\n"
+            "for idx in range(500):\n"
+            "    doc.text(str(idx))\n",
+        ],
+        check=True,
+        cwd=RELATIVE_PATH.parent,
+        env=environment,
+    )
+    assert "| Lines produced | 500 |" in output.read_text(encoding="UTF-8")
@@ -0,0 +1,77 @@
+"""Tests for the table sinks."""
+import json
+from inspect import cleandoc
+from io import StringIO
+
+from testfixtures import compare
+
+from markdown_toolkit.document import MarkdownDocument
+from markdown_toolkit.sinks import CSVSink, JSONLSink
+
+ROWS = [
+    {"Apple Type": "Golden Delicious", "Grown Count": 2},
+    {"Apple Type": "Granny Smith", "Grown Count": 3},
+    {"Apple Type": "Pink Lady", "Grown Count": 5},
+]
+
+
+def test_sinks(tmp_path, monkeypatch):
+    expected_lines = cleandoc(
+        """
+        | Apple Type | Grown Count |
+        | --- | --- |
+        | Golden Delicious | 2 |
+        | Granny Smith | 3 |
+        | **Sum** | 10 |
+
+        Showing 2 of 3 rows. Full data: [apples.csv](apples.csv)
+        """
+    )
+    jsonl = StringIO()
+    monkeypatch.chdir(tmp_path)
+    doc = MarkdownDocument()
+    with CSVSink("apples.csv") as csv_sink:
+        doc.table(
+            iter(ROWS),
+            titles=["Apple Type", "Grown Count"],
+            aggregates={"Grown Count": "sum"},
+            sinks=[csv_sink, JSONLSink(jsonl)],
+            truncate=2,
+        )
+    compare(doc.render(), expected=expected_lines + "\n")
+    compare(
+        (tmp_path / "apples.csv").read_bytes().decode("UTF-8"),
+        expected=(
+            "Apple Type,Grown Count\r\n"
+            "Golden Delicious,2\r\n"
+            "Granny Smith,3\r\n"
+            "Pink Lady,5\r\n"
+        ),
+    )
+    compare([json.loads(line) for line in jsonl.getvalue().splitlines()], ROWS)
+
+
+def test_sinks_url(tmp_path):
+    doc = MarkdownDocument()
+    with CSVSink(tmp_path / "apples.csv") as absolute, JSONLSink(
+        tmp_path / "apples.jsonl", url="data/apples.jsonl"
+    ) as linked:
+        doc.table(ROWS, sinks=[absolute, linked], truncate=1)
+    assert absolute.url is None
+    assert doc.render().endswith(
+        "Showing 1 of 3 rows. Full data: [data/apples.jsonl](data/apples.jsonl)\n"
+    )
+
+
+def test_sinks_add_row():
+    file_object = StringIO()
+    doc = MarkdownDocument()
+    with doc.table(
+        titles=["Apple Type", "Grown Count"], sinks=[JSONLSink(file_object)]
+    ) as table:
+        table.add_row(apple_type="Granny Smith")
+    compare(
+        json.loads(file_object.getvalue()),
+        {"Apple Type": "Granny Smith", "Grown Count": None},
+    )
+    assert "| Granny Smith |  |" in doc.render()
@@ -1,9 +1,12 @@
+import inspect
+import random
 from inspect import cleandoc
 from pathlib import Path
 from io import StringIO
 
 import pytest
 
+from markdown_toolkit import utils
 from markdown_toolkit.utils import (
     badge,
     bold,
@@ -325,3 +328,36 @@ def test_fileobj_obj():
         content = file.read()
         expected.seek(0)
         assert content == expected.read()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "   ",
+        "single line",
+        "   leading whitespace",
+        "trailing whitespace   ",
+        "\ttabbed",
+        "\n\n   text after blank lines\n\n",
+        """
+        Indented
+            Nested
+        Dedented
+        """,
+        "First line\n    second\n      third\n",
+        "First line\n\tTabbed\n\t\tDouble tabbed",
+        "First\n   \n     \n   Indented",
+        "First\n   ",
+        "\n".join(["    line"] * 50),
+    ],
+)
+def test_cleandoc(text):
+    assert utils.cleandoc(text) == inspect.cleandoc(text)
+
+
+def test_cleandoc_random():
+    rng = random.Random(0)
+    for _ in range(2_000):
+        text = "".join(rng.choice(["a", "b", " ", " ", "\t", "\n"]) for _ in range(20))
+        assert utils.cleandoc(text) == inspect.cleandoc(text)
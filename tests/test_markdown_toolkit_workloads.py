@@ -0,0 +1,52 @@
+"""Tests for the synthetic workload generator."""
+from io import StringIO
+
+import pytest
+
+from markdown_toolkit.bench.workloads import generate, main, write
+from markdown_toolkit.injector import MarkdownInjector
+
+
+def test_generate_deterministic():
+    assert list(generate(2_000, seed=1)) == list(generate(2_000, seed=1))
+    assert list(generate(2_000, seed=1)) != list(generate(2_000, seed=2))
+
+
+@pytest.mark.parametrize("lines", [0, 1, 7, 1_000, 12_345])
+def test_generate_line_count(lines):
+    assert len(list(generate(lines))) == lines
+
+
+def test_generate_shapes():
+    document = list(generate(5_000, list_depth=3, table_columns=12, heading_depth=5))
+    list_indents = {
+        len(line) - len(line.lstrip())
+        for line in document
+        if line.lstrip().startswith(("*   ", "1.  "))
+    }
+    assert list_indents == {0, 4, 8}
+    assert max(line.count("#") for line in document if line.startswith("#")) == 5
+    assert any(line.count("|") == 13 for line in document)
+
+
+@pytest.mark.parametrize("lines", [1_000, 20_000])
+def test_generate_anchors_scaling(lines):
+    text = "\n".join(generate(lines, anchor_density=0.005, anchor_nesting=3))
+    injector = MarkdownInjector(StringIO(text))
+    anchors = vars(injector.anchors)
+    assert len(anchors) == lines // 200
+    indents = {anchor.indent for anchor in anchors.values()}
+    assert len(indents) > 1
+    assert indents <= {0, 4, 8, 12}
+
+
+def test_write(tmp_path):
+    path = write(tmp_path / "fixture.md", 25_000, chunk_size=1_000, seed=3)
+    expected = "".join(line + "\n" for line in generate(25_000, seed=3))
+    assert path.read_text(encoding="UTF-8") == expected
+
+
+def test_cli(tmp_path):
+    main([str(tmp_path / "fixture.md"), "--lines=500", "--seed=4"])
+    text = (tmp_path / "fixture.md").read_text(encoding="UTF-8")
+    assert text.splitlines() == list(generate(500, seed=4))